@@ -1,10 +1,14 @@
 from src.ExperimentRunner import ExperimentRunner
 from src.Models.Gemini import Gemini
+from src.PopulationInitializers.GRASPInitializer import GRASPInitializer
 from src.PopulationInitializers.RandomInitializer import RandomInitializer
 from src.PopulationInitializers.SAPopulationInitializer import (
     SAPopulationInitializer as SAInitializer,
 )
+from src.PopulationInitializers.TabuSearchInitializer import TabuSearchInitializer
+from src.Solvers.IslandPAIRSolver import IslandPAIRSolver
 from src.Solvers.PAIRSolver import PAIRSolver
+from src.Solvers.RobustTabuSearchSolver import RobustTabuSearchSolver
 
 
 def get_user_input(prompt):
@@ -22,11 +26,13 @@ def select_option(options, prompt):
 def get_experiment_inputs():
     problem_name = get_user_input("Enter the name of the problem: ")
     tsp_path = get_user_input("Enter the path to the problem file: ")
-    optimal_distance = float(
-        get_user_input("Enter the optimal solution for the problem: ")
-    )
+    # an empty answer uses the optimum from qapsoln, or only the lower bound if there is none
+    optimal_input = get_user_input(
+        "Enter the optimal solution for the problem (leave empty to look it up): "
+    ).strip()
+    optimal_distance = float(optimal_input) if optimal_input else None
 
-    solvers = ["PAIR_solver"]
+    solvers = ["PAIR_solver", "PAIR_islands", "robust_tabu_search"]
     solver_name = select_option(solvers, "Select the solver to use:")
 
     models = [
@@ -36,10 +42,14 @@ def get_experiment_inputs():
     ]
     model_name = select_option(models, "Select the model to use:")
 
-    population_initializers = ["simulated-annealing", "random"]
+    population_initializers = ["simulated-annealing", "random", "robust-tabu-search", "grasp"]
     population_initializer_name = select_option(
         population_initializers, "Select the population initializer to use:"
     )
+    # initial populations are cached per instance, initializer and seed
+    regenerate_population = get_user_input(
+        "Regenerate the initial population instead of reusing a cached one? [y/N]: "
+    ).strip().lower() in ("y", "yes")
 
     return {
         "problem_name": problem_name,
@@ -48,6 +58,7 @@ def get_experiment_inputs():
         "solver_name": solver_name,
         "model_name": model_name,
         "population_initializer_name": population_initializer_name,
+        "regenerate_population": regenerate_population,
     }
 
 
@@ -64,6 +75,10 @@ def initialize_experiment(inputs):
         population_initializer = SAInitializer()
     elif inputs["population_initializer_name"] == "random":
         population_initializer = RandomInitializer()
+    elif inputs["population_initializer_name"] == "robust-tabu-search":
+        population_initializer = TabuSearchInitializer()
+    elif inputs["population_initializer_name"] == "grasp":
+        population_initializer = GRASPInitializer()
     else:
         raise Exception("Population initializer not found.")
 
@@ -80,6 +95,10 @@ def initialize_experiment(inputs):
     """ Initialize solver"""
     if inputs["solver_name"] == "PAIR_solver":
         solver = PAIRSolver(model, population_initializer)
+    elif inputs["solver_name"] == "PAIR_islands":
+        solver = IslandPAIRSolver(model, population_initializer)
+    elif inputs["solver_name"] == "robust_tabu_search":
+        solver = RobustTabuSearchSolver(model, population_initializer)
     else:
         raise Exception("Solver not found")
 
@@ -89,6 +108,8 @@ def initialize_experiment(inputs):
         inputs["optimal_distance"],
         solver,
         model,
+        inputs["solver_name"],
+        regeneratePopulation=inputs["regenerate_population"],
     )
 
 
@@ -6,6 +6,7 @@ from typing import Any, Dict
 
 import pandas as pd
 
+from src.Population.Population import Population
 from src.QAPLoader.QAPLibLoader import QAPLIBLoader
 from src.QAPLoader.QAPProblem import QAPProblem
 
@@ -20,12 +21,13 @@ class ExperimentDataManager:
         problemFilePath: str,
         problemName: str,
         modelName: str,
-        optimalDistance: float,
+        optimalDistance: float | None,
         solverName: str = "PAIR_solver",
+        timestamp: str | None = None,
     ):
         # Initialize basic properties
         self._init_properties(
-            problemFilePath, problemName, modelName, solverName, optimalDistance
+            problemFilePath, problemName, modelName, solverName, optimalDistance, timestamp
         )
 
         # Setup directory structure and files
@@ -39,6 +41,7 @@ class ExperimentDataManager:
         modelName: str,
         solverName: str,
         optimalDistance: float,
+        timestamp: str | None = None,
     ) -> None:
         """Initialize instance properties"""
         self.problem: QAPProblem = QAPLIBLoader.load_from_file(problemFilePath)
@@ -48,7 +51,8 @@ class ExperimentDataManager:
         self.solverName = solverName
         self.nodeCount = self.problem.n
         self.optimalDistance = optimalDistance
-        self.timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # runs sharing a timestamp, e.g. the islands of one experiment, are grouped by it
+        self.timestamp = timestamp or datetime.now().strftime("%Y%m%d_%H%M%S")
 
     def _setup_directory_structure(self) -> None:
         """Setup directory structure and copy problem file if needed"""
@@ -68,6 +72,11 @@ class ExperimentDataManager:
         self.log_file = self.problem_dir / f"{self._get_file_prefix()}_log.txt"
         with open(self.log_file, "w") as f:
             f.write(f"Experiment Log: {self.timestamp}\n")
+            f.write(
+                f"Cost kernel: {self.problem.kernel} "
+                f"(density {self.problem.density:.3f}, nnz {self.problem.nnz}), "
+                f"matrices: {self.problem.distance_matrix.dtype}, {self.problem.memory_bytes} bytes\n"
+            )
             f.write("=" * 80 + "\n")
 
     def _get_file_prefix(self) -> str:
@@ -83,6 +92,9 @@ class ExperimentDataManager:
         bestSolutionProportion: float,
         populationSize: int,
         optimalityGap: float,
+        lowerBound: float | None,
+        boundGap: float,
+        duplicates: int | None,
     ) -> Dict[str, list]:
         """Prepare iteration data for CSV storage"""
         return {
@@ -93,6 +105,9 @@ class ExperimentDataManager:
             "distance": [distance],
             "optimal distance": [self.optimalDistance],
             "gap": [optimalityGap],
+            "lower bound": [lowerBound],
+            "bound gap": [boundGap],
+            "duplicates": [duplicates],
             "temperature": [modelTemperature],
             "population size": [populationSize],
             "variance": [generationVariance],
@@ -123,6 +138,9 @@ class ExperimentDataManager:
         bestSolutionProportion: float,
         populationSize: int,
         optimalityGap: float,
+        lowerBound: float | None = None,
+        boundGap: float = float("nan"),
+        duplicates: int | None = None,
     ) -> None:
         file_path = self.problem_dir / f"{self._get_file_prefix()}_iterations.csv"
         data = self._get_iteration_data(
@@ -133,6 +151,9 @@ class ExperimentDataManager:
             bestSolutionProportion,
             populationSize,
             optimalityGap,
+            lowerBound,
+            boundGap,
+            duplicates,
         )
         self._write_to_csv(file_path, data)
 
@@ -194,12 +215,89 @@ class ExperimentDataManager:
             """)
         self._log_to_file(message)
 
-    def logPopulation(self, population: list):
+    def logPopulation(self, population: Population):
+        message = (
+            f"\nPopulation: {len(population)} individuals, "
+            f"cost variance {population.variance():.2f}, "
+            f"best proportion {population.bestProportion():.3f}, "
+            f"mean Hamming distance {population.diversity():.2f}\n"
+            f"{population}\n"
+        )
+        self._log_to_file(message)
+
+    def logInitialization(self, wallTime: float, individuals: int, runStats: dict | None = None):
+        message = f"Initialization: {individuals} individuals in {wallTime:.3f}s"
+        if runStats is not None and "cached" in runStats:
+            message += f", loaded from {runStats['cached']}"
+        if runStats is not None and "uncached" in runStats:
+            message += f", not cached ({runStats['uncached']})"
+        if runStats is not None and "iterations_per_second" in runStats:
+            message += (
+                f", {runStats['iterations']} local search iterations "
+                f"at {runStats['iterations_per_second']:.1f} iterations/s"
+            )
+        if runStats is not None and "workers" in runStats:
+            message += f" across {len(runStats['workers'])} workers ({runStats['chunks']} chunks)"
+            for pid, worker in runStats["workers"].items():
+                message += (
+                    f"\n    worker {pid}: {worker['individuals']} individuals in "
+                    f"{worker['busy_time']:.3f}s, {worker['throughput']:.1f} individuals/s"
+                )
+        self._log_to_file(message)
+
+    def logCacheStats(self, generationHits: int, generationMisses: int, costCache):
+        message = dedent(f"""
+            Cost cache: {generationHits} offspring already seen, {generationMisses} new
+            Cost cache total: {costCache.hits} hits, {costCache.misses} misses, hit rate {costCache.hit_rate:.3f}, {len(costCache)}/{costCache.capacity} entries, {costCache.evictions} evictions
+            """)
+        self._log_to_file(message)
+
+    def logSearchSpeed(self, iterations: int, busyTime: float):
+        speed = iterations / busyTime if busyTime > 0 else 0.0
+        self._log_to_file(f"Local search: {iterations} iterations in {busyTime:.3f}s, {speed:.1f} iterations/s")
+
+    def logLocalSearch(self, lengthsBefore: list, lengthsAfter: list, moves: int, wallTime: float):
+        recovered = [before - after for before, after in zip(lengthsBefore, lengthsAfter)]
         message = dedent(f"""
-            {population}
+            Local search: {sum(r > 0 for r in recovered)}/{len(recovered)} offspring improved by {moves} swaps in {wallTime:.3f}s
+            Local search recovered: {sum(recovered)} total, {max(recovered, default=0)} max, best offspring {min(lengthsBefore, default=None)} -> {min(lengthsAfter, default=None)}
             """)
         self._log_to_file(message)
 
+    def logImprovementSources(
+        self,
+        previousBest: float,
+        bestOffspring: float | None,
+        bestBackground: float | None,
+        backgroundStats: dict,
+    ):
+        offspringGain = max(0, previousBest - bestOffspring) if bestOffspring is not None else 0
+        backgroundGain = max(0, previousBest - bestBackground) if bestBackground is not None else 0
+        iterationsPerSecond = (
+            backgroundStats["iterations"] / backgroundStats["busy_time"]
+            if backgroundStats["busy_time"] > 0
+            else 0.0
+        )
+        message = dedent(f"""
+            Improvement sources: LLM offspring {bestOffspring} (gain {offspringGain}), background search {bestBackground} (gain {backgroundGain}) over {previousBest}
+            Background search: {backgroundStats['iterations']} iterations in {backgroundStats['busy_time']:.3f}s ({iterationsPerSecond:.1f} iterations/s) during a {backgroundStats['latency']:.3f}s request
+            """)
+        self._log_to_file(message)
+
+    def logIsland(
+        self,
+        island: int,
+        bestSolution: float,
+        generations: int,
+        wallTime: float,
+        emigrants: int,
+        immigrants: int,
+    ):
+        self._log_to_file(
+            f"Island {island}: best sol {bestSolution} after {generations} generations in {wallTime:.1f}s, "
+            f"{emigrants} individuals sent, {immigrants} received"
+        )
+
     def logError(self, error: str):
         message = f"ERROR: {error}"
         self._log_to_file(message)
@@ -1,16 +1,37 @@
+from pathlib import Path
+
 from src.Solvers.LLMTSPSolver import LLMTSPSolver
 from src.ExperimentDataManager import ExperimentDataManager
 from src.Models.Model import Model
+from src.PopulationInitializers.CachedInitializer import CachedInitializer
+from src.QAPLoader.InstanceCache import InstanceCache
+from src.QAPLoader.InstanceCatalog import InstanceCatalog
 
 
 class ExperimentRunner:
     def __init__(self,
                  problemName: str,
                  problemFilePath: str,
-                 problemOptimalDistance: float,
+                 problemOptimalDistance: float | None,
                  solver: LLMTSPSolver,
                  model: Model,
+                 solverName: str = "PAIR_solver",
+                 cachePopulation: bool = True,
+                 regeneratePopulation: bool = False,
                  ):
+        # fall back to the optimum bundled in qapsoln when none is given
+        if problemOptimalDistance is None:
+            problemOptimalDistance = InstanceCatalog.default().optimum(Path(problemFilePath).stem)
+
+        # reuse the initial population of earlier runs with the same instance, initializer and seed,
+        # unseeded initializers draw a new one every run
+        if cachePopulation:
+            solver.population_initializer = CachedInitializer(
+                solver.population_initializer,
+                InstanceCache.file_hash(Path(problemFilePath)),
+                regeneratePopulation,
+            )
+
         # initialize member variables
         self.solver = solver
         self.problemName = problemName
@@ -20,7 +41,7 @@ class ExperimentRunner:
 
         # load tsp problem
         self.expDataManager = \
-            ExperimentDataManager(problemFilePath, problemName, self.model.modelName, problemOptimalDistance)
+            ExperimentDataManager(problemFilePath, problemName, self.model.modelName, problemOptimalDistance, solverName)
         self.problem = self.expDataManager.problem
 
         print(f"ExperimentRunner created with solver: {solver}")
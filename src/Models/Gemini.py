@@ -1,3 +1,4 @@
+import asyncio
 import os
 import time
 
@@ -73,6 +74,42 @@ class Gemini(Model):
                 errors += 1
                 continue
 
+    async def run_async(self, prompt: str) -> str:
+        errors = 0
+        while True:
+            try:
+                response = await self.client.aio.models.generate_content(
+                    model=self.modelName,
+                    contents=prompt,
+                    config=types.GenerateContentConfig(
+                        system_instruction=self.systemPrompt,
+                        temperature=self.temperature,
+                        thinking_config=types.ThinkingConfig(
+                            thinking_budget=0
+                        )
+                    ),
+                )
+                return response.text
+            except Exception as e:
+                print(f"Error while making the Model's async call: {e}")
+                # concurrent requests cannot ask the user, give up and let the caller retry
+                if (errors + 1) % 10 == 0:
+                    raise e
+
+                await asyncio.sleep(1)  # Sleep for 1s before retrying
+                errors += 1
+                continue
+
+    def __getstate__(self):
+        # the client holds connections, island workers build their own
+        state = self.__dict__.copy()
+        state["client"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.configure(self.systemPrompt, self.temperature)
+
     def set_temperature(self, temperature: float):
         self.temperature = temperature
 
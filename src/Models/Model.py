@@ -1,3 +1,4 @@
+import asyncio
 from abc import abstractmethod
 
 
@@ -20,6 +21,14 @@ class Model:
         """
         pass
 
+    async def run_async(self, prompt: str) -> str:
+        """
+        Awaitable version of run, so several prompts can be in flight at once.
+        Runs the blocking call in a worker thread unless a model overrides it
+        with a native async client.
+        """
+        return await asyncio.to_thread(self.run, prompt)
+
     @abstractmethod
     def set_temperature(self, temperature: int):
         pass
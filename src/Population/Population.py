@@ -0,0 +1,224 @@
+from typing import Iterable, Iterator, NamedTuple
+
+import numpy as np
+
+
+class Individual(NamedTuple):
+    """One member of a Population: a view of its 0-based assignment and its cost."""
+
+    assignment: np.ndarray
+    cost: float
+
+
+class Population:
+    """
+    Individuals stored as a (m, n) int32 array of assignments and a vector of their
+    costs, sorted by cost descendingly so the best individual is last.
+
+    Rows are shifted to start at 0 on the way in, so the 1-based and 0-based forms
+    of a permutation are the same individual. Only the first occurrence of a
+    permutation is kept and the others are counted in `duplicates`. The bytes of
+    every row are indexed in a set, so a membership test costs O(n).
+
+    Populations are not modified in place: merge, difference and select build new
+    ones. Indexing, slicing and iteration return views of the arrays.
+    """
+
+    __slots__ = ("assignments", "costs", "duplicates", "_keys")
+
+    def __init__(self, assignments=(), costs=(), n: int | None = None):
+        """
+        Args:
+            assignments: (m, n) array-like of 0-based or 1-based assignments, one per row
+            costs: the m costs
+            n: assignment length, only needed when there are no assignments
+        """
+        costs = np.asarray(costs)
+        if costs.size == 0:
+            # QAP costs are integers, an empty population must not turn merged costs into floats
+            costs = costs.astype(np.int64)
+        assignments = np.asarray(assignments, dtype=np.int32)
+        if assignments.ndim != 2:
+            assignments = (
+                assignments.reshape(len(costs), -1)
+                if len(costs)
+                else np.empty((0, n or 0), dtype=np.int32)
+            )
+
+        if assignments.size:
+            offsets = assignments.min(axis=1, keepdims=True)
+            if offsets.any():
+                assignments = assignments - offsets
+
+        # first row of every permutation, in input order
+        rows = len(costs)
+        keys: dict[bytes, int] = {}
+        for index, row in enumerate(assignments):
+            keys.setdefault(row.tobytes(), index)
+        kept = np.fromiter(keys.values(), dtype=np.intp, count=len(keys))
+
+        # the stable sort keeps the input order between equal costs
+        order = kept[np.argsort(-costs[kept], kind="stable")]
+        if len(order) < rows or (order != np.arange(rows)).any():
+            assignments, costs = assignments[order], costs[order]
+
+        self.assignments: np.ndarray = assignments
+        self.costs: np.ndarray = costs
+
+        """ Rows dropped because their permutation was already present """
+        self.duplicates = rows - len(kept)
+        self._keys: set[bytes] | None = set(keys)
+
+    @classmethod
+    def fromIndividuals(
+        cls, individuals: Iterable[tuple[list[int], float]], n: int | None = None
+    ) -> "Population":
+        """Population of (assignment, cost) pairs."""
+        individuals = list(individuals)
+        return cls(
+            [assignment for assignment, _ in individuals],
+            [cost for _, cost in individuals],
+            n,
+        )
+
+    @classmethod
+    def concatenate(cls, populations: Iterable["Population"], n: int | None = None) -> "Population":
+        """One population of the rows of several, earlier ones winning between duplicates."""
+        populations = list(populations)
+        if not populations:
+            return cls(n=n)
+        population = cls(
+            np.concatenate([part.assignments for part in populations]),
+            np.concatenate([part.costs for part in populations]),
+            n,
+        )
+        population.duplicates += sum(part.duplicates for part in populations)
+        return population
+
+    @classmethod
+    def _sorted(cls, assignments: np.ndarray, costs: np.ndarray, duplicates: int = 0) -> "Population":
+        """Wrap arrays that already are 0-based, unique and sorted descendingly."""
+        population = cls.__new__(cls)
+        population.assignments = assignments
+        population.costs = costs
+        population.duplicates = duplicates
+        population._keys = None
+        return population
+
+    @property
+    def n(self) -> int:
+        return self.assignments.shape[1]
+
+    @property
+    def best(self) -> Individual:
+        return self[-1]
+
+    def _index(self) -> set[bytes]:
+        if self._keys is None:
+            self._keys = {row.tobytes() for row in self.assignments}
+        return self._keys
+
+    def __contains__(self, assignment) -> bool:
+        locations = np.asarray(assignment, dtype=np.int32)
+        if locations.size:
+            locations = locations - locations.min()
+        return locations.tobytes() in self._index()
+
+    def __len__(self) -> int:
+        return len(self.costs)
+
+    def __iter__(self) -> Iterator[Individual]:
+        for assignment, cost in zip(self.assignments, self.costs.tolist()):
+            yield Individual(assignment, cost)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            if index.step is not None and index.step < 0:
+                raise ValueError("a population slice keeps the descending order, the step must be positive")
+            return self._sorted(self.assignments[index], self.costs[index])
+        return Individual(self.assignments[index], self.costs[index].item())
+
+    def __str__(self) -> str:
+        return "\n".join(
+            f"{cost}: {','.join(map(str, assignment))}"
+            for assignment, cost in zip(self.assignments.tolist(), self.costs.tolist())
+        )
+
+    def __repr__(self) -> str:
+        best = self.costs[-1].item() if len(self) else None
+        return f"Population({len(self)} individuals, n={self.n}, best={best})"
+
+    def difference(self, other: "Population") -> "Population":
+        """
+        The individuals whose permutation is not in other, as a new population.
+        Its `duplicates` adds the individuals found in other to this population's.
+        """
+        index = other._index()
+        fresh = np.fromiter(
+            (k for k, row in enumerate(self.assignments) if row.tobytes() not in index),
+            dtype=np.intp,
+        )
+        return self._sorted(
+            self.assignments[fresh],
+            self.costs[fresh],
+            self.duplicates + len(self) - len(fresh),
+        )
+
+    def merge(self, other: "Population", k: int | None = None) -> "Population":
+        """
+        The union of both populations, keeping the k cheapest individuals or all of them.
+
+        Only the individuals of other missing from this population are hashed, and
+        the k survivors are found with a partition before being sorted, so a merge
+        costs O(len(other) n + m + k log k) for the m individuals of the union.
+        `duplicates` counts the individuals of other already present.
+        """
+        fresh = other.difference(self)
+        assignments = np.concatenate([self.assignments, fresh.assignments])
+        costs = np.concatenate([self.costs, fresh.costs])
+
+        if k is None or k >= len(costs):
+            survivors = np.arange(len(costs))
+        elif k <= 0:
+            survivors = np.empty(0, dtype=np.intp)
+        else:
+            # ascending indices make the order between equal costs deterministic
+            survivors = np.sort(np.argpartition(costs, k - 1)[:k])
+        order = survivors[np.argsort(-costs[survivors], kind="stable")]
+
+        return self._sorted(
+            assignments[order], costs[order], len(other) - len(fresh)
+        )
+
+    def select(self, indices) -> "Population":
+        """The individuals at the given (distinct) indices, sorted descendingly."""
+        indices = np.asarray(indices, dtype=np.intp)
+        order = indices[np.argsort(-self.costs[indices], kind="stable")]
+        return self._sorted(self.assignments[order], self.costs[order])
+
+    def variance(self) -> float:
+        """Variance of the costs."""
+        return float(np.var(self.costs))
+
+    def bestProportion(self) -> float:
+        """Share of the individuals having the best cost."""
+        return float(np.mean(self.costs == self.costs.min()))
+
+    def diversity(self) -> float:
+        """
+        Mean Hamming distance over all pairs of individuals.
+
+        Two individuals agree on facility j when they put it on the same location,
+        so the agreeing pairs are counted from how many individuals put every
+        facility on every location, in O(m n) instead of comparing all pairs.
+        """
+        m, n = self.assignments.shape
+        if m < 2:
+            return 0.0
+        pairs = m * (m - 1) // 2
+        placements = np.bincount(
+            (self.assignments + n * np.arange(n, dtype=np.int64)).ravel(),
+            minlength=n * n,
+        )
+        agreeing = int((placements * (placements - 1) // 2).sum())
+        return n - agreeing / pairs
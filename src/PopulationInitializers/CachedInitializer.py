@@ -0,0 +1,161 @@
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+
+from src.Population.Population import Population
+from src.PopulationInitializers.PopulationInitializer import PopulationInitializer
+from src.QAPLoader.QAPProblem import QAPPopulationInitializer, QAPProblem
+
+
+class CachedInitializer(PopulationInitializer):
+    """
+    Reuses initial populations stored on disk.
+
+    A population is stored in CACHE_DIR/<key>.npz, where key is the SHA-1 of the
+    instance file hash, the initializer class and configuration (seed included,
+    nested initializers and selectors too) and the population size. Runs with the
+    same key get the identical population, so experiments sweeping models or
+    temperatures start from the same individuals. Unseeded initializers, or
+    wrappers of one, are not cached, so repeated runs stay independent; use
+    regenerate to draw a new population for a seeded one.
+    """
+
+    CACHE_DIR = Path("data") / "populations"
+
+    # attributes holding the state of the last run rather than configuration
+    RUN_STATE = ("problem", "rng", "lastRunStats")
+
+    def __init__(
+        self,
+        initializer: PopulationInitializer,
+        instance_hash: str,
+        regenerate: bool = False,
+        cache_dir=CACHE_DIR,
+    ):
+        """
+        Args:
+            initializer: initializer run on a cache miss
+            instance_hash: hash of the instance file content, see InstanceCache.file_hash
+            regenerate: ignore stored populations and overwrite them
+            cache_dir: directory holding the populations
+        """
+        self.initializer = initializer
+        self.instance_hash = instance_hash
+        self.regenerate = regenerate
+        self.cache_dir = Path(cache_dir)
+        self.problem = None
+
+        """ Stats of the wrapped initializer, or the cache file on a hit """
+        self.lastRunStats: dict | None = None
+
+    @classmethod
+    def describe(cls, value):
+        """JSON-serializable description of an initializer's configuration."""
+        if value is None or isinstance(value, (bool, int, float, str)):
+            return value
+        if isinstance(value, np.generic):
+            return value.item()
+        if isinstance(value, (list, tuple)):
+            return [cls.describe(item) for item in value]
+        if isinstance(value, dict):
+            return {str(key): cls.describe(item) for key, item in value.items()}
+        if hasattr(value, "__dict__"):
+            return {
+                "class": type(value).__name__,
+                **{
+                    key: cls.describe(item)
+                    for key, item in sorted(vars(value).items())
+                    if key not in cls.RUN_STATE and not key.startswith("_")
+                },
+            }
+        return repr(value)
+
+    @classmethod
+    def seeded(cls, initializer) -> bool:
+        """
+        Whether an initializer draws the same population on every run: it and every
+        initializer nested in it have a seed. A wrapper without a seed of its own
+        is seeded through the initializers it wraps. An initializer whose seed only
+        drives some of its random draws says so through a `reproducible` attribute.
+        """
+        nested = [
+            value
+            for value in vars(initializer).values()
+            if isinstance(value, (PopulationInitializer, QAPPopulationInitializer))
+        ]
+        if not all(cls.seeded(value) for value in nested):
+            return False
+        if hasattr(initializer, "reproducible"):
+            return initializer.reproducible
+        if hasattr(initializer, "seed"):
+            return initializer.seed is not None
+        return bool(nested)
+
+    def key(self, population_size: int) -> dict:
+        return {
+            "instance": self.instance_hash,
+            "initializer": self.describe(self.initializer),
+            "seed": self.describe(getattr(self.initializer, "seed", None)),
+            "population_size": population_size,
+        }
+
+    def path(self, population_size: int) -> Path:
+        key = json.dumps(self.key(population_size), sort_keys=True)
+        name = type(self.initializer).__name__
+        return self.cache_dir / f"{name}_{hashlib.sha1(key.encode()).hexdigest()}.npz"
+
+    def initialize(
+        self, population_size: int, problem: QAPProblem
+    ) -> Population:
+        """returns the stored population if there is one, otherwise builds and stores it"""
+        self.problem = problem
+
+        # a population drawn without a seed is only valid for this run
+        if not self.seeded(self.initializer):
+            population = self.initializer.initialize(population_size, problem)
+            self.lastRunStats = {
+                **(getattr(self.initializer, "lastRunStats", None) or {}),
+                "uncached": "unseeded initializer",
+            }
+            return population
+
+        path = self.path(population_size)
+        if not self.regenerate:
+            population = self._load(path, problem)
+            if population is not None:
+                self.lastRunStats = {"cached": str(path)}
+                return population
+
+        population = self.initializer.initialize(population_size, problem)
+        self.lastRunStats = getattr(self.initializer, "lastRunStats", None)
+        self._store(path, population, population_size)
+        return population
+
+    @staticmethod
+    def _load(path: Path, problem: QAPProblem) -> Population | None:
+        try:
+            with np.load(path) as data:
+                assignments, costs = data["assignments"], data["costs"]
+        except (OSError, ValueError, KeyError):
+            return None
+        if assignments.ndim != 2 or assignments.shape[1] != problem.n:
+            return None
+        return Population(assignments, costs)
+
+    def _store(self, path: Path, population: Population, population_size: int) -> None:
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            temporary = path.with_name(f"{path.stem}.{os.getpid()}.tmp.npz")
+            np.savez(
+                temporary,
+                assignments=population.assignments,
+                costs=population.costs,
+                key=json.dumps(self.key(population_size), sort_keys=True),
+            )
+            os.replace(temporary, path)
+        except OSError:
+            # an unwriteable cache only costs the next run its initialization time
+            pass
@@ -0,0 +1,37 @@
+from src.Population.Population import Population
+from src.PopulationInitializers.DiversitySelector import DiversitySelector
+from src.PopulationInitializers.PopulationInitializer import PopulationInitializer
+from src.QAPLoader.QAPProblem import QAPProblem
+
+
+class DiverseInitializer(PopulationInitializer):
+    """
+    Oversamples any population initializer and keeps a diverse subset.
+
+    The wrapped initializer builds oversampling times the requested population and
+    the selector keeps population_size individuals balancing cost and Hamming
+    distance, instead of the cheapest ones.
+    """
+
+    def __init__(
+        self,
+        initializer: PopulationInitializer,
+        selector: DiversitySelector | None = None,
+        oversampling: int = 4,
+    ):
+        self.initializer = initializer
+        self.selector = selector or DiversitySelector()
+        self.oversampling = max(1, oversampling)
+        self.problem = None
+
+    @property
+    def lastRunStats(self) -> dict | None:
+        return getattr(self.initializer, "lastRunStats", None)
+
+    def initialize(
+        self, population_size: int, problem: QAPProblem
+    ) -> Population:
+        """returns the selected individuals of the wrapped initializer"""
+        self.problem = problem
+        candidates = self.initializer.initialize(population_size * self.oversampling, problem)
+        return self.selector.select_population(candidates, population_size)
@@ -0,0 +1,92 @@
+import numpy as np
+
+from src.Population.Population import Population
+
+
+class DiversitySelector:
+    """
+    Picks k individuals out of a candidate pool, trading cost against diversity.
+
+    The cheapest candidate is always kept. Every further pick maximizes
+
+        (1 - diversity_weight) * quality + diversity_weight * spread
+
+    where quality is the cost rescaled to [0, 1] over the pool (1 is the cheapest)
+    and spread is the Hamming distance to the closest individual picked so far
+    divided by n. Duplicates of a picked individual have a spread of 0, so they
+    are only taken once nothing else is left. A weight of 0 keeps the k cheapest.
+    """
+
+    # Upper bound on the boolean comparisons materialized at once by hamming_matrix
+    CHUNK_ELEMENTS = 1 << 24
+
+    def __init__(self, diversity_weight: float = 0.3):
+        if not 0.0 <= diversity_weight <= 1.0:
+            raise ValueError(f"diversity_weight must be in [0, 1], got {diversity_weight}")
+        self.diversity_weight = diversity_weight
+
+    @classmethod
+    def hamming_matrix(cls, assignments) -> np.ndarray:
+        """
+        Pairwise Hamming distances of a (m, n) array of assignments.
+
+        Returns:
+            (m, m) array, entry [a][b] is the number of facilities on different locations
+        """
+        assignments = np.asarray(assignments)
+        m, n = assignments.shape
+        distances = np.empty((m, m), dtype=np.int32)
+
+        rows = max(1, cls.CHUNK_ELEMENTS // max(1, m * n))
+        for start in range(0, m, rows):
+            block = assignments[start:start + rows]
+            distances[start:start + rows] = (block[:, None, :] != assignments[None, :, :]).sum(axis=2)
+        return distances
+
+    def select(self, assignments, costs, k: int) -> np.ndarray:
+        """
+        Indices of the k selected candidates, from the most expensive to the cheapest.
+
+        Args:
+            assignments: (m, n) array-like, one candidate per row
+            costs: the m candidate costs
+            k: number of candidates to keep
+        """
+        costs = np.asarray(costs, dtype=np.float64)
+        m = len(costs)
+        k = min(k, m)
+        if k <= 0:
+            return np.empty(0, dtype=np.intp)
+        if k == m or self.diversity_weight == 0.0:
+            chosen = np.argsort(costs, kind="stable")[:k]
+            return chosen[np.argsort(-costs[chosen], kind="stable")]
+
+        assignments = np.asarray(assignments)
+        n = assignments.shape[1]
+        distances = self.hamming_matrix(assignments)
+
+        span = costs.max() - costs.min()
+        quality = (costs.max() - costs) / span if span > 0 else np.ones(m)
+        quality *= 1.0 - self.diversity_weight
+        spreadWeight = self.diversity_weight / max(1, n)
+
+        chosen = [int(np.argmin(costs))]
+        closest = distances[chosen[0]].astype(np.float64)
+        available = np.ones(m, dtype=bool)
+        available[chosen[0]] = False
+
+        for _ in range(k - 1):
+            scores = np.where(available, quality + spreadWeight * closest, -np.inf)
+            pick = int(np.argmax(scores))
+            chosen.append(pick)
+            available[pick] = False
+            np.minimum(closest, distances[pick], out=closest)
+
+        chosen = np.asarray(chosen, dtype=np.intp)
+        return chosen[np.argsort(-costs[chosen], kind="stable")]
+
+    def select_population(self, population: Population, k: int) -> Population:
+        """Select k individuals of a population."""
+        if not len(population):
+            return population
+        return population.select(self.select(population.assignments, population.costs, k))
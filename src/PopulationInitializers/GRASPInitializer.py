@@ -0,0 +1,134 @@
+import numpy as np
+
+from src.Population.Population import Population
+from src.PopulationInitializers.PopulationInitializer import PopulationInitializer
+from src.QAPLoader.QAPProblem import QAPProblem
+from src.QAPLoader.SwapNeighborhood import SwapNeighborhood
+
+
+class GRASPInitializer(PopulationInitializer):
+    """
+    Greedy randomized adaptive construction followed by a swap local search,
+    after Li, Pardalos and Resende.
+
+    Stage one pairs the facility pairs with the highest flows with the location
+    pairs with the lowest distances, and places one of the rcl_size pairings with
+    the smallest flow times distance products. Stage two places the remaining
+    facilities one at a time: c[i][k], the cost that placing facility i on location
+    k adds against everything placed so far, is kept for all pairs at once and one
+    of the rcl_size cheapest free pairs is picked. Every individual is then
+    improved with best-improvement swaps.
+
+    Individuals are independent given self.rng, so the initializer can be wrapped
+    in a ParallelInitializer.
+    """
+
+    def __init__(
+        self,
+        rcl_size: int = 5,
+        pair_fraction: float = 0.5,
+        local_search_moves: int | None = None,
+        seed: int | None = None,
+    ):
+        """
+        Args:
+            rcl_size: number of cheapest candidates a random choice is made from, 1 is pure greedy
+            pair_fraction: share of the facility and location pairs considered in stage one
+            local_search_moves: cap on the local search swaps, None runs to a local optimum
+            seed: seed of the random generator
+        """
+        self.problem = None
+        self.rcl_size = max(1, rcl_size)
+        self.pair_fraction = pair_fraction
+        self.local_search_moves = local_search_moves
+        self.seed = seed
+        self.rng = np.random.default_rng(seed)
+
+    def initialize(
+        self, population_size: int, problem: QAPProblem
+    ) -> Population:
+        """returns the locally optimal assignments as a Population"""
+        self.problem = problem
+
+        flow = np.asarray(problem.flow_matrix, dtype=np.int64)
+        distance = np.asarray(problem.distance_matrix, dtype=np.int64)
+        flowPairs, distancePairs = self._rankPairs(flow, distance)
+
+        assignments = np.empty((population_size, problem.n), dtype=np.int32)
+        costs = np.empty(population_size, dtype=np.int64)
+        for k in range(population_size):
+            assignment = self._construct(flow, distance, flowPairs, distancePairs)
+            neighborhood = SwapNeighborhood(problem, assignment)
+            costs[k] = neighborhood.local_search(self.local_search_moves)
+            assignments[k] = neighborhood.assignment
+
+        return Population(assignments, costs)
+
+    def _rankPairs(self, flow: np.ndarray, distance: np.ndarray):
+        """Facility pairs by decreasing flow and location pairs by increasing distance, both truncated."""
+        n = self.problem.n
+        rows, cols = np.triu_indices(n, k=1)
+        pairFlows = flow[rows, cols] + flow[cols, rows]
+        pairDistances = distance[rows, cols] + distance[cols, rows]
+
+        kept = max(1, int(self.pair_fraction * len(rows)))
+        byFlow = np.argsort(-pairFlows, kind="stable")[:kept]
+        byDistance = np.argsort(pairDistances, kind="stable")[:kept]
+
+        # the k-th heaviest facility pair is matched with the k-th closest location pair
+        products = pairFlows[byFlow] * pairDistances[byDistance]
+        order = np.argsort(products, kind="stable")
+        flowPairs = np.stack([rows[byFlow], cols[byFlow]], axis=1)[order]
+        distancePairs = np.stack([rows[byDistance], cols[byDistance]], axis=1)[order]
+        return flowPairs, distancePairs
+
+    def _construct(
+        self,
+        flow: np.ndarray,
+        distance: np.ndarray,
+        flowPairs: np.ndarray,
+        distancePairs: np.ndarray,
+    ) -> np.ndarray:
+        """Build one 0-based assignment with the two GRASP stages."""
+        n = self.problem.n
+        assignment = np.full(n, -1, dtype=np.intp)
+        if n == 1:
+            assignment[0] = 0
+            return assignment
+
+        # stage one: seed two facilities on two locations
+        pick = self.rng.integers(min(self.rcl_size, len(flowPairs)))
+        (a, b), (k, l) = flowPairs[pick], distancePairs[pick]
+        if self.rng.random() < 0.5:
+            k, l = l, k
+
+        # increment[i][k]: cost added by placing facility i on location k given the placed ones
+        increment = np.zeros((n, n), dtype=np.int64)
+        freeFacility = np.ones(n, dtype=bool)
+        freeLocation = np.ones(n, dtype=bool)
+
+        def place(facility: int, location: int) -> None:
+            assignment[facility] = location
+            freeFacility[facility] = False
+            freeLocation[location] = False
+            increment[:] += np.outer(flow[:, facility], distance[:, location])
+            increment[:] += np.outer(flow[facility, :], distance[location, :])
+
+        place(a, k)
+        place(b, l)
+
+        # stage two: greedy randomized placement of the other facilities
+        for remaining in range(n - 2, 0, -1):
+            facilities = np.flatnonzero(freeFacility)
+            locations = np.flatnonzero(freeLocation)
+            candidates = increment[np.ix_(facilities, locations)].ravel()
+
+            size = min(self.rcl_size, candidates.size)
+            if size < candidates.size:
+                rcl = np.argpartition(candidates, size - 1)[:size]
+            else:
+                rcl = np.arange(candidates.size)
+            chosen = rcl[self.rng.integers(size)]
+            place(facilities[chosen // remaining], locations[chosen % remaining])
+
+        return assignment
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from src.Population.Population import Population
 from src.QAPLoader.QAPProblem import QAPProblem
 
 class PopulationInitializer(ABC):
@@ -8,6 +9,6 @@ class PopulationInitializer(ABC):
     """
 
     @abstractmethod
-    def initialize(self, population_size: int, problem: QAPProblem) -> list[tuple[list,int]]:
-        """ returns a list of tuples. each tuple contains a 1-based tsp trace and its length """
+    def initialize(self, population_size: int, problem: QAPProblem) -> Population:
+        """ returns the individuals and their costs as a Population, best individual last """
         pass
\ No newline at end of file
@@ -1,30 +1,52 @@
-import random
+import numpy as np
 
+from src.Population.Population import Population
+from src.PopulationInitializers.DiversitySelector import DiversitySelector
 from src.PopulationInitializers.PopulationInitializer import PopulationInitializer
 from src.QAPLoader.QAPProblem import QAPProblem
 
 
 class RandomInitializer(PopulationInitializer):
-    def __init__(self):
+    def __init__(
+        self,
+        oversampling: int = 6,
+        seed: int | None = None,
+        selector: DiversitySelector | None = None,
+    ):
+        """ oversampling: random candidates generated per individual kept
+            selector: keeps a diverse subset of the candidates instead of the cheapest """
         self.problem = None
+        self.oversampling = oversampling
+        self.seed = seed
+        self.rng = np.random.default_rng(seed)
+        self.selector = selector
 
     def initialize(
         self, population_size: int, problem: QAPProblem
-    ) -> list[tuple[list, int]]:
-        """returns a list of tuples. each tuple contains a 1-based tsp trace and its length"""
+    ) -> Population:
+        """returns the cheapest (or selected) random assignments as a Population"""
         self.problem: QAPProblem = problem
 
         node_count = problem.n
-        population = []
-        for i in range(population_size * 6):
-            tour: list[int] = [point for point in range(1, node_count + 1)]
-            random.shuffle(tour)
-            trace_fitness: int = problem.calculate_cost(tour)
-            population.append((tour, trace_fitness))
-
-        population.sort(key=lambda x: x[1], reverse=True)
-        population = population[-population_size:]      # This is necessairy, it takes the smallest "population_size" solutions.
-        return population
+        candidate_count = max(population_size * self.oversampling, population_size)
+
+        # every row of random keys argsorts to an independent uniform permutation
+        tours = np.argsort(self.rng.random((candidate_count, node_count)), axis=1)
+
+        # score every candidate in a single batched call
+        tours_fitness = problem.calculate_costs(tours, one_based=False)
+
+        if self.selector is not None:
+            best = self.selector.select(tours, tours_fitness, population_size)
+            return Population(tours[best], tours_fitness[best])
+
+        # keep the population_size cheapest without sorting every candidate
+        if population_size < candidate_count:
+            best = np.argpartition(tours_fitness, population_size - 1)[:population_size]
+        else:
+            best = np.arange(candidate_count)
+
+        return Population(tours[best], tours_fitness[best])
 
 
 # problem = tsplib95.load('/Users/shadyali/Downloads/clu_25_10.tsp')
@@ -1,4 +1,5 @@
 import tsplib95
+from src.Population.Population import Population
 from src.PopulationInitializers.PopulationInitializer import PopulationInitializer
 import random
 import numpy as np
@@ -9,8 +10,8 @@ class SAPopulationInitializer(PopulationInitializer):
     def __init__(self):
         self.problem = None
 
-    def initialize(self, population_size: int, problem: tsplib95.models.StandardProblem) -> list[tuple[list, int]]:
-        """ returns a list of tuples. each tuple contains a 1-based tsp trace and its length """
+    def initialize(self, population_size: int, problem: tsplib95.models.StandardProblem) -> Population:
+        """ returns the annealed tours and their lengths as a Population """
 
         self.problem = problem
 
@@ -23,9 +24,7 @@ class SAPopulationInitializer(PopulationInitializer):
             tour, length = self._simulated_annealing(cooling_rate=cooling_rate)
             population.append((tour, length))
 
-        """ convert to one-based indexing """
-        population = [([city + 1 for city in tour], length) for tour, length in population]
-        return population
+        return Population.fromIndividuals(population)
 
     def _calculate_total_distance(self, tour):
         """Calculate the total distance of the TSP tour."""
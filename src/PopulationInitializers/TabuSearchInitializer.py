@@ -0,0 +1,56 @@
+import time
+
+import numpy as np
+
+from src.Population.Population import Population
+from src.PopulationInitializers.PopulationInitializer import PopulationInitializer
+from src.QAPLoader.QAPProblem import QAPProblem
+from src.QAPLoader.RobustTabuSearch import RobustTabuSearch
+
+
+class TabuSearchInitializer(PopulationInitializer):
+    def __init__(self, iterations_per_node: int = 20, seed: int | None = None):
+        """ iterations_per_node: robust tabu search iterations per individual, as a multiple of n """
+        self.problem = None
+        self.iterations_per_node = iterations_per_node
+        self.seed = seed
+        self.rng = None
+
+        """ Wall time and search speed of the last initialize call """
+        self.lastRunStats: dict | None = None
+
+    def initialize(
+        self, population_size: int, problem: QAPProblem
+    ) -> Population:
+        """returns the best assignment of every search as a Population"""
+        self.problem = problem
+
+        # ParallelInitializer re-seeds workers through self.rng, keep one search and its generator
+        search = RobustTabuSearch(problem, seed=self.seed)
+        if self.rng is not None:
+            search.rng = self.rng
+        self.rng = search.rng
+
+        iterations = self.iterations_per_node * problem.n
+        assignments = np.empty((population_size, problem.n), dtype=np.int32)
+        costs = np.empty(population_size, dtype=np.int64)
+        totalIterations, busyTime = 0, 0.0
+        start = time.perf_counter()
+        for k in range(population_size):
+            # every individual is an independent search from a random start
+            search.reset()
+            search.search(iterations)
+            totalIterations += search.iteration
+            busyTime += search.elapsed
+            assignments[k] = search.best_assignment
+            costs[k] = search.best_cost
+
+        population = Population(assignments, costs)
+
+        self.lastRunStats = {
+            "wall_time": time.perf_counter() - start,
+            "individuals": population_size,
+            "iterations": totalIterations,
+            "iterations_per_second": totalIterations / busyTime if busyTime > 0 else 0.0,
+        }
+        return population
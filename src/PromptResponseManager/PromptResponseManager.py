@@ -2,6 +2,8 @@ import random
 import re
 from textwrap import dedent
 
+from src.Population.Population import Population
+
 
 class PromptResponseManager:
     """
@@ -63,7 +65,7 @@ class PromptResponseManager:
 
     @staticmethod
     def getNewGenerationPrompt(
-        population: list[tuple[list, int]], problemSize: int, populationSize: int
+        population: Population, problemSize: int, populationSize: int
     ) -> str:
         prompt = dedent(f"""**facilities count:** {problemSize}
             **locations count:** {problemSize}
@@ -75,14 +77,16 @@ class PromptResponseManager:
     # endregion public methods
 
     @staticmethod
-    def structureAssignmentsAndCosts(population: list[tuple[list, int]]) -> str:
+    def structureAssignmentsAndCosts(population: Population) -> str:
         # make Assignments and Costs into a string format for the llm prompt
         # <assignment>0,1,2,3,4,5,6,7</assignment>,cost:4300; <assignment>2,6,4,0,5,7,1,3</assignment>,cost:5200;....
-        assignments = ""
-        for assignment, cost in population:
-            assignments += f"<assignment>{','.join(str(facility) for facility in assignment)}</assignment>,cost:{cost};"
-
-        return assignments
+        # the rows are converted to Python ints once for the whole population
+        return "".join(
+            f"<assignment>{','.join(map(str, assignment))}</assignment>,cost:{cost};"
+            for assignment, cost in zip(
+                population.assignments.tolist(), population.costs.tolist()
+            )
+        )
 
     @staticmethod
     def getPAIRSelectionPrompt() -> str:
@@ -0,0 +1,99 @@
+from collections import OrderedDict
+from typing import List
+
+import numpy as np
+
+from src.QAPLoader.QAPProblem import QAPProblem
+
+
+class CostCache:
+    """
+    Bounded LRU cache of assignment costs for a QAP problem.
+
+    Keys are the bytes of the 0-based assignment as int32, so equal permutations
+    hit no matter whether they arrive as lists or arrays. Misses are scored in
+    one batched call and the least recently used entries are evicted once the
+    capacity is reached.
+    """
+
+    def __init__(self, problem: QAPProblem, capacity: int = 10000):
+        """
+        Args:
+            problem: QAP problem instance used to score misses
+            capacity: maximum number of cached assignments
+        """
+        if capacity < 1:
+            raise ValueError(f"Cache capacity must be positive, current is {capacity}")
+
+        self.problem = problem
+        self.capacity = capacity
+        self._entries = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, assignment) -> bool:
+        """Whether the assignment has been seen, without touching its recency or the counters."""
+        return self._key(assignment) in self._entries
+
+    @staticmethod
+    def _key(assignment) -> bytes:
+        return np.asarray(assignment, dtype=np.int32).tobytes()
+
+    def costs(self, assignments) -> List:
+        """
+        Return the costs of a batch of 0-based assignments, scoring only the misses.
+
+        Args:
+            assignments: sequence of assignments where assignment[i] is the location of facility i
+
+        Returns:
+            List of costs in the order of assignments
+        """
+        keys = [self._key(assignment) for assignment in assignments]
+        costs = [None] * len(keys)
+
+        missing = {}
+        for index, key in enumerate(keys):
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                costs[index] = self._entries[key]
+                self.hits += 1
+            else:
+                # Repeats inside the batch are scored once
+                missing.setdefault(key, []).append(index)
+                self.misses += 1
+
+        if missing:
+            first = [indices[0] for indices in missing.values()]
+            scored = self.problem.calculate_costs([assignments[index] for index in first], one_based=False)
+            for (key, indices), cost in zip(missing.items(), scored):
+                cost = cost.item()
+                for index in indices:
+                    costs[index] = cost
+                self._put(key, cost)
+
+        return costs
+
+    def _put(self, key: bytes, cost) -> None:
+        self._entries[key] = cost
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
@@ -0,0 +1,159 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class DownloadCache:
+    """
+    Content-addressed cache of downloaded text files with a pooled HTTP session.
+
+    Bodies are stored once under objects/<sha1> and index.json maps every URL to
+    its object together with the ETag and Last-Modified headers of the response.
+    Entries younger than max_age are served without a request; older ones are
+    revalidated with a conditional GET, and a 304 reuses the stored body. When the
+    server cannot be reached a cached body is served even if it is stale.
+    """
+
+    CACHE_DIR = Path(".cache") / "qaplib"
+    TIMEOUT = 30
+    POOL_SIZE = 16
+
+    _session = None
+    _lock = threading.Lock()
+
+    def __init__(self, cache_dir=CACHE_DIR, max_age: float = 7 * 24 * 3600, offline: bool = False):
+        """
+        Args:
+            cache_dir: directory holding the objects and the index
+            max_age: seconds a cached body is served without revalidation
+            offline: never touch the network, only serve cached bodies
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_age = max_age
+        self.offline = offline
+        self._index = self._read_index()
+
+    @classmethod
+    def session(cls) -> requests.Session:
+        """Session shared by every cache, so connections to the same host are reused."""
+        with cls._lock:
+            if cls._session is None:
+                cls._session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=cls.POOL_SIZE, pool_maxsize=cls.POOL_SIZE)
+                cls._session.mount("http://", adapter)
+                cls._session.mount("https://", adapter)
+            return cls._session
+
+    @property
+    def _index_path(self) -> Path:
+        return self.cache_dir / "index.json"
+
+    def _object_path(self, digest: str) -> Path:
+        return self.cache_dir / "objects" / digest
+
+    def _read_index(self) -> Dict[str, dict]:
+        try:
+            with open(self._index_path, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_index(self) -> None:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        temporary = self._index_path.with_name(f"index.json.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(temporary, "w") as f:
+            json.dump(self._index, f)
+        os.replace(temporary, self._index_path)
+
+    def _read_object(self, entry: Optional[dict]) -> Optional[str]:
+        if entry is None:
+            return None
+        try:
+            with open(self._object_path(entry["sha1"]), "r") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _store(self, url: str, content: str, response: requests.Response) -> None:
+        data = content.encode()
+        digest = hashlib.sha1(data).hexdigest()
+        path = self._object_path(digest)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temporary = path.with_name(f"{digest}.{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(temporary, "wb") as f:
+                f.write(data)
+            os.replace(temporary, path)
+
+        with self._lock:
+            self._index[url] = {
+                "sha1": digest,
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "checked_at": time.time(),
+            }
+            self._write_index()
+
+    def get(self, url: str) -> str:
+        """
+        Return the body of url, from the cache when it is fresh or still valid.
+
+        Raises:
+            requests.RequestException: if the download fails and nothing is cached
+        """
+        entry = self._index.get(url)
+        cached = self._read_object(entry)
+
+        if cached is not None and (self.offline or time.time() - entry["checked_at"] < self.max_age):
+            return cached
+        if self.offline:
+            raise requests.RequestException(f"{url} is not cached and offline mode is on")
+
+        headers = {}
+        if cached is not None:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+        try:
+            response = self.session().get(url, headers=headers, timeout=self.TIMEOUT)
+            if response.status_code == 304 and cached is not None:
+                with self._lock:
+                    entry["checked_at"] = time.time()
+                    self._write_index()
+                return cached
+            response.raise_for_status()
+        except requests.RequestException:
+            # A stale copy beats no copy when the server is unreachable
+            if cached is not None:
+                return cached
+            raise
+
+        self._store(url, response.text, response)
+        return response.text
+
+    def prefetch(self, urls: List[str], max_workers: int = 8) -> Dict[str, Optional[str]]:
+        """
+        Download several URLs concurrently into the cache.
+
+        Returns:
+            Mapping of every URL to None on success or to the error message
+        """
+        def fetch(url: str) -> Optional[str]:
+            try:
+                self.get(url)
+                return None
+            except requests.RequestException as e:
+                return str(e)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return dict(zip(urls, executor.map(fetch, urls)))
@@ -0,0 +1,139 @@
+import argparse
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Optional, Tuple
+
+import numpy as np
+
+from src.QAPLoader.QAPProblem import QAPProblem
+
+
+class InstanceCache:
+    """
+    Binary cache of parsed QAPLIB matrices, stored next to the source files.
+
+    For qapdata/tai256c.dat the matrices are kept in qapdata/.cache/tai256c.dat.npy as
+    one (2, n, n) array (distance then flow) in the problem's storage dtype, and
+    qapdata/.cache/tai256c.dat.json records the size, mtime and SHA-1 of the source.
+    A matching size and mtime is trusted as is; otherwise the source is hashed and
+    the entry is reused if only the mtime changed. Hits are memory mapped.
+    """
+
+    CACHE_DIRNAME = ".cache"
+
+    @classmethod
+    def _paths(cls, filepath: Path) -> Tuple[Path, Path]:
+        cache_dir = filepath.parent / cls.CACHE_DIRNAME
+        return cache_dir / f"{filepath.name}.npy", cache_dir / f"{filepath.name}.json"
+
+    @staticmethod
+    def file_hash(filepath: Path) -> str:
+        """SHA-1 hex digest of a file's content."""
+        with open(filepath, "rb") as f:
+            return hashlib.sha1(f.read()).hexdigest()
+
+    @classmethod
+    def load(cls, filepath, name: str) -> Optional[QAPProblem]:
+        """
+        Return the cached problem for a source file, or None on a miss.
+
+        Args:
+            filepath: path of the .dat source file
+            name: problem name to give the QAPProblem
+        """
+        filepath = Path(filepath)
+        matrices_path, meta_path = cls._paths(filepath)
+        if not (matrices_path.exists() and meta_path.exists()):
+            return None
+
+        try:
+            with open(meta_path, "r") as f:
+                meta = json.load(f)
+            stat = filepath.stat()
+
+            if (meta["size"], meta["mtime_ns"]) != (stat.st_size, stat.st_mtime_ns):
+                if meta["size"] != stat.st_size or meta["sha1"] != cls.file_hash(filepath):
+                    return None
+                # Same content with a new mtime, e.g. after a fresh checkout
+                meta["mtime_ns"] = stat.st_mtime_ns
+                cls._write_json(meta_path, meta)
+
+            matrices = np.load(matrices_path, mmap_mode="r")
+        except (OSError, ValueError, KeyError):
+            return None
+
+        return QAPProblem(matrices[0], matrices[1], name)
+
+    @classmethod
+    def store(cls, filepath, problem: QAPProblem) -> bool:
+        """
+        Write the matrices of a problem parsed from filepath to the cache.
+
+        Returns:
+            False if the cache directory is not writeable, True otherwise
+        """
+        filepath = Path(filepath)
+        matrices_path, meta_path = cls._paths(filepath)
+
+        try:
+            matrices_path.parent.mkdir(exist_ok=True)
+            stat = filepath.stat()
+            meta = {
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "sha1": cls.file_hash(filepath),
+                "n": problem.n,
+                "dtype": str(problem.distance_matrix.dtype),
+            }
+
+            # Write to temporary files first so readers never see a partial entry
+            temporary = matrices_path.with_name(f"{matrices_path.name}.{os.getpid()}.tmp")
+            with open(temporary, "wb") as f:
+                np.save(f, np.stack([problem.distance_matrix, problem.flow_matrix]))
+            os.replace(temporary, matrices_path)
+            cls._write_json(meta_path, meta)
+        except OSError:
+            return False
+
+        return True
+
+    @staticmethod
+    def _write_json(path: Path, data: dict) -> None:
+        temporary = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(temporary, "w") as f:
+            json.dump(data, f)
+        os.replace(temporary, path)
+
+    @classmethod
+    def warm(cls, directory="qapdata", pattern: str = "*.dat") -> Tuple[int, int]:
+        """
+        Parse and cache every instance in a directory that is not cached yet.
+
+        Returns:
+            (number of instances cached, number that failed to parse)
+        """
+        from src.QAPLoader.QAPLibLoader import QAPLIBLoader
+
+        cached, failed = 0, 0
+        for filepath in sorted(Path(directory).glob(pattern)):
+            try:
+                QAPLIBLoader.load_from_file(str(filepath))
+                cached += 1
+            except (IOError, ValueError) as e:
+                print(f"Skipping {filepath}: {e}")
+                failed += 1
+
+        return cached, failed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pre-warm the binary cache of QAPLIB instances.")
+    parser.add_argument("directories", nargs="*", default=["qapdata"])
+    parser.add_argument("--pattern", default="*.dat")
+    args = parser.parse_args()
+
+    for directory in args.directories:
+        cached, failed = InstanceCache.warm(directory, args.pattern)
+        print(f"{directory}: {cached} instances cached, {failed} failed")
@@ -0,0 +1,153 @@
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from src.QAPLoader.InstanceCache import InstanceCache
+
+
+class InstanceCatalog:
+    """
+    Index of the QAPLIB instances shipped in qapdata/ with their qapsoln/ solutions.
+
+    Every entry holds the size, the optimum or best known cost, the best known
+    assignment, matrix symmetry, the cost kernel with its density and the SHA-1 of
+    the data file. The index is persisted as one JSON file in the data directory's
+    cache folder and refreshed incrementally: only instances whose .dat or .sln
+    mtime changed are parsed again, and removed files are dropped.
+    """
+
+    DATA_DIR = Path("qapdata")
+    SOLUTION_DIR = Path("qapsoln")
+    INDEX_FILENAME = "catalog.json"
+
+    _default = None
+
+    def __init__(self, data_dir=DATA_DIR, solution_dir=SOLUTION_DIR):
+        self.data_dir = Path(data_dir)
+        self.solution_dir = Path(solution_dir)
+        self.index_path = self.data_dir / InstanceCache.CACHE_DIRNAME / self.INDEX_FILENAME
+        self.entries: Dict[str, dict] = {}
+
+        self._read_index()
+        self.refresh()
+
+    @classmethod
+    def default(cls) -> "InstanceCatalog":
+        """Catalog of the bundled directories, built once per process."""
+        if cls._default is None:
+            cls._default = cls()
+        return cls._default
+
+    def _read_index(self) -> None:
+        try:
+            with open(self.index_path, "r") as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def _write_index(self) -> None:
+        try:
+            self.index_path.parent.mkdir(exist_ok=True)
+            temporary = self.index_path.with_name(f"{self.index_path.name}.{os.getpid()}.tmp")
+            with open(temporary, "w") as f:
+                json.dump(self.entries, f)
+            os.replace(temporary, self.index_path)
+        except OSError:
+            # A read-only checkout still gets an in-memory catalog
+            pass
+
+    @staticmethod
+    def _mtime(filepath: Path) -> Optional[int]:
+        return filepath.stat().st_mtime_ns if filepath.exists() else None
+
+    def refresh(self) -> int:
+        """
+        Re-index the instances whose files changed since the index was written.
+
+        Returns:
+            Number of instances that were (re-)indexed
+        """
+        entries = {}
+        updated = 0
+        for data_path in sorted(self.data_dir.glob("*.dat")):
+            name = data_path.stem
+            solution_path = self.solution_dir / f"{name}.sln"
+            mtimes = {
+                "data_mtime_ns": self._mtime(data_path),
+                "solution_mtime_ns": self._mtime(solution_path),
+            }
+
+            entry = self.entries.get(name)
+            if entry is None or any(entry.get(key) != value for key, value in mtimes.items()):
+                entry = self._index_instance(name, data_path, solution_path)
+                entry.update(mtimes)
+                updated += 1
+            entries[name] = entry
+
+        removed = len(set(self.entries) - set(entries))
+        self.entries = entries
+        if updated or removed:
+            self._write_index()
+
+        return updated
+
+    @staticmethod
+    def _index_instance(name: str, data_path: Path, solution_path: Path) -> dict:
+        from src.QAPLoader.QAPLibLoader import QAPLIBLoader
+
+        entry = {"name": name, "sha1": InstanceCache.file_hash(data_path)}
+        try:
+            problem = QAPLIBLoader.load_from_file(str(data_path), name)
+        except (IOError, ValueError) as e:
+            entry["error"] = str(e)
+            return entry
+
+        entry.update({
+            "n": problem.n,
+            "symmetric_distance": bool(np.array_equal(problem.distance_matrix, problem.distance_matrix.T)),
+            "symmetric_flow": bool(np.array_equal(problem.flow_matrix, problem.flow_matrix.T)),
+            "kernel": problem.kernel,
+            "density": round(problem.density, 4),
+            "optimum": None,
+            "assignment": None,
+        })
+
+        if solution_path.exists():
+            try:
+                cost, permutation = QAPLIBLoader.load_solution_from_file(str(solution_path), name)
+            except (IOError, ValueError):
+                return entry
+            entry["optimum"] = cost
+
+            # The .sln files list either the assignment or its inverse, keep the one that scores
+            if sorted(permutation) == list(range(problem.n)):
+                candidates = [permutation, np.argsort(permutation).tolist()]
+                costs = problem.calculate_costs(candidates)
+                for candidate, candidate_cost in zip(candidates, costs):
+                    if candidate_cost == cost:
+                        entry["assignment"] = candidate
+                        break
+
+        return entry
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.entries and "error" not in self.entries[name]
+
+    def get(self, name: str) -> Optional[dict]:
+        """Return the entry of an instance, None if it is unknown or failed to parse."""
+        return self.entries[name] if name in self else None
+
+    def optimum(self, name: str) -> Optional[int]:
+        """Return the optimum or best known cost of an instance, None if it has no solution."""
+        entry = self.get(name)
+        return entry["optimum"] if entry is not None else None
+
+    def names(self, max_size: Optional[int] = None) -> List[str]:
+        """Return the parseable instance names, optionally only those with n <= max_size."""
+        return [
+            name for name, entry in self.entries.items()
+            if "error" not in entry and (max_size is None or entry["n"] <= max_size)
+        ]
@@ -0,0 +1,137 @@
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, Optional
+
+import numpy as np
+from scipy.optimize import linear_sum_assignment
+
+from src.QAPLoader.QAPProblem import QAPProblem
+
+
+class QAPBounds:
+    """
+    Lower bounds on the optimal cost of a QAP instance.
+
+    Used to report a gap when no optimum is known and to stop a solver once its
+    incumbent reaches a bound, which proves it optimal. Computed bounds are
+    cached on disk per instance, keyed by a hash of the matrices.
+    """
+
+    CACHE_DIR = Path("data") / "bounds"
+
+    @staticmethod
+    def gilmore_lawler(problem: QAPProblem) -> int:
+        """
+        Gilmore–Lawler bound.
+
+        Placing facility i at location k costs at least F[i][i] * D[k][k] plus the
+        minimal scalar product of row i of F and row k of D without their diagonal
+        entries (one sorted ascending, the other descending). The bound is the
+        optimal linear assignment over these n x n costs.
+        """
+        F = np.asarray(problem.flow_matrix, dtype=np.int64)
+        D = np.asarray(problem.distance_matrix, dtype=np.int64)
+        n = problem.n
+        if n < 2:
+            return int((F * D).sum())
+
+        off_diagonal = ~np.eye(n, dtype=bool)
+        flows = np.sort(F[off_diagonal].reshape(n, n - 1), axis=1)
+        distances = np.sort(D[off_diagonal].reshape(n, n - 1), axis=1)[:, ::-1]
+
+        costs = flows @ distances.T + np.outer(np.diag(F), np.diag(D))
+        rows, cols = linear_sum_assignment(costs)
+        return int(costs[rows, cols].sum())
+
+    @staticmethod
+    def projection(problem: QAPProblem) -> Optional[int]:
+        """
+        Projection bound of Hadley, Rendl and Wolkowicz.
+
+        A permutation matrix is X = ee^T/n + V Y V^T with V an orthonormal basis of
+        the complement of e and Y orthogonal. This splits the cost into a constant,
+        a linear term minimised by pairing the row sums of F and D in opposite order,
+        and a quadratic term bounded by the eigenvalues of V^T F V and V^T D V.
+        If only one matrix is symmetric the other can be replaced by its symmetric
+        part without changing any cost. Returns None if neither is symmetric.
+        """
+        F = np.asarray(problem.flow_matrix, dtype=np.float64)
+        D = np.asarray(problem.distance_matrix, dtype=np.float64)
+        if not (np.array_equal(F, F.T) or np.array_equal(D, D.T)):
+            return None
+        F, D = (F + F.T) / 2, (D + D.T) / 2
+        n = problem.n
+
+        # The first QR column is parallel to e, the others span its complement
+        basis, _ = np.linalg.qr(np.column_stack([np.ones(n), np.eye(n)[:, :-1]]))
+        V = basis[:, 1:]
+        flow_eigenvalues = np.linalg.eigvalsh(V.T @ F @ V)
+        distance_eigenvalues = np.linalg.eigvalsh(V.T @ D @ V)
+        quadratic = flow_eigenvalues @ distance_eigenvalues[::-1]
+
+        flow_sums, distance_sums = F.sum(axis=1), D.sum(axis=1)
+        linear = 2 / n * (np.sort(flow_sums) @ np.sort(distance_sums)[::-1])
+        constant = flow_sums.sum() * distance_sums.sum() / n ** 2
+
+        bound = float(quadratic + linear - constant)
+        return int(np.ceil(bound - 1e-6 * max(1.0, abs(bound))))
+
+    @classmethod
+    def compute(cls, problem: QAPProblem, use_cache: bool = True) -> Dict[str, Optional[int]]:
+        """
+        Return every bound of a problem, plus "best", the tightest of them.
+
+        Args:
+            problem: QAP problem instance
+            use_cache: read and write the bounds from CACHE_DIR
+        """
+        cache_path = cls._cache_path(problem)
+        if use_cache:
+            try:
+                with open(cache_path, "r") as f:
+                    return json.load(f)
+            except (OSError, ValueError):
+                # missing or unreadable, compute the bounds again
+                pass
+
+        bounds = {
+            "gilmore_lawler": cls.gilmore_lawler(problem),
+            "projection": cls.projection(problem),
+        }
+        bounds["best"] = max(bound for bound in bounds.values() if bound is not None)
+
+        if use_cache:
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                # processes computing the same bounds never see a half-written file
+                temporary = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+                with open(temporary, "w") as f:
+                    json.dump(bounds, f)
+                os.replace(temporary, cache_path)
+            except OSError:
+                pass
+
+        return bounds
+
+    @classmethod
+    def lower_bound(cls, problem: QAPProblem, use_cache: bool = True) -> int:
+        """Return the tightest available lower bound of a problem."""
+        return cls.compute(problem, use_cache)["best"]
+
+    @staticmethod
+    def gap(cost: float, bound: float) -> float:
+        """Percentage gap of a cost above a lower bound, nan if the bound is not positive."""
+        if bound is None or bound <= 0:
+            return float("nan")
+        return round((cost - bound) / bound * 100, 2)
+
+    @classmethod
+    def _cache_path(cls, problem: QAPProblem) -> Path:
+        digest = hashlib.sha1()
+        for matrix in (problem.distance_matrix, problem.flow_matrix):
+            digest.update(str(matrix.dtype).encode())
+            digest.update(np.ascontiguousarray(matrix).tobytes())
+        name = problem.name or "problem"
+        return cls.CACHE_DIR / f"{name}_{digest.hexdigest()[:16]}.json"
@@ -1,7 +1,13 @@
 import numpy as np
 import requests
 import io
-from typing import Optional, Dict, List
+import threading
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional, Dict, List, Tuple
+from src.QAPLoader.DownloadCache import DownloadCache
+from src.QAPLoader.InstanceCache import InstanceCache
 from src.QAPLoader.QAPProblem import QAPProblem
 
 class QAPLIBLoader:
@@ -11,6 +17,15 @@ class QAPLIBLoader:
     
     BASE_URL_DAT = "https://coral.ise.lehigh.edu/wp-content/uploads/2014/07/data.d"
     BASE_URL_SLN = "https://coral.ise.lehigh.edu/wp-content/uploads/2014/07/soln.d"
+
+    # Mirror mode looks in these directories first, then at MIRROR_URL if it is set
+    # (any server exposing <name>.dat and <name>.sln, e.g. `python -m http.server`)
+    MIRROR_DATA_DIR = Path("qapdata")
+    MIRROR_SOLUTION_DIR = Path("qapsoln")
+    MIRROR_URL: Optional[str] = None
+
+    _download_cache: Optional[DownloadCache] = None
+    _download_cache_lock = threading.Lock()
     
     # Some popular QAPLIB instances
     POPULAR_INSTANCES = {
@@ -137,12 +152,14 @@ class QAPLIBLoader:
     }
 
     @classmethod
-    def load_from_url(cls, problem_name: str) -> QAPProblem:
+    def load_from_url(cls, problem_name: str, mirror: bool = True) -> QAPProblem:
         """
         Load a QAPLIB problem instance from the online repository.
         
         Args:
             problem_name: Name of the problem (e.g., 'chr12a', 'nug12', etc.)
+            mirror: Resolve the name against MIRROR_DATA_DIR and MIRROR_URL before
+                    the online repository
             
         Returns:
             QAPProblem instance
@@ -151,84 +168,215 @@ class QAPLIBLoader:
             ValueError: If problem name is not found
             requests.RequestException: If download fails
         """
-        if problem_name not in cls.POPULAR_INSTANCES:
+        local_path = cls.MIRROR_DATA_DIR / f"{problem_name}.dat"
+        if mirror and local_path.exists():
+            return cls.load_from_file(str(local_path), problem_name)
+
+        content = cls._download(problem_name, "dat", mirror)
+        return cls._parse_qap_data(content, problem_name)
+
+    @classmethod
+    def _candidate_urls(cls, problem_name: str, extension: str, mirror: bool) -> List[str]:
+        """URLs to try in order for a .dat or .sln file."""
+        urls = []
+        if mirror and cls.MIRROR_URL:
+            urls.append(f"{cls.MIRROR_URL.rstrip('/')}/{problem_name}.{extension}")
+        if problem_name in cls.POPULAR_INSTANCES:
+            base_url = cls.BASE_URL_DAT if extension == "dat" else cls.BASE_URL_SLN
+            urls.append(f"{base_url}/{problem_name}.{extension}")
+
+        if not urls:
             raise ValueError(f"Problem '{problem_name}' not found. Available problems: {list(cls.POPULAR_INSTANCES.keys())}")
-        
-        filename = cls.POPULAR_INSTANCES[problem_name]
-        url = f"{cls.BASE_URL_DAT}/{filename}"
-        
-        try:
-            response = requests.get(url)
-            response.raise_for_status()
-            content = response.text
-            return cls._parse_qap_data(content, problem_name)
-        except requests.RequestException as e:
-            raise requests.RequestException(f"Failed to download {problem_name}: {e}")
+        return urls
+
+    @classmethod
+    def _download(cls, problem_name: str, extension: str, mirror: bool) -> str:
+        """Return the text of a .dat or .sln file from the first URL that serves it."""
+        errors = []
+        for url in cls._candidate_urls(problem_name, extension, mirror):
+            try:
+                return cls.download_cache().get(url)
+            except requests.RequestException as e:
+                errors.append(f"{url}: {e}")
+
+        raise requests.RequestException(f"Failed to download {problem_name}: {'; '.join(errors)}")
+
+    @classmethod
+    def download_cache(cls) -> DownloadCache:
+        """Download cache shared by every load, created on first use."""
+        # prefetch threads may ask for it first, only one of them may create it
+        with cls._download_cache_lock:
+            if cls._download_cache is None:
+                cls._download_cache = DownloadCache()
+        return cls._download_cache
+
+    @classmethod
+    def prefetch(cls, problem_names: List[str], solutions: bool = True, max_workers: int = 8) -> Dict[str, Optional[str]]:
+        """
+        Download the instances (and solutions) that are not in the local mirror concurrently.
+
+        Every file is fetched like a load does, trying MIRROR_URL before the QAPLIB
+        site, so a failing mirror falls back to the original.
+
+        Returns:
+            Mapping of every requested file, as <name>.<extension>, to None on success
+            or to the error message
+        """
+        files = []
+        for problem_name in problem_names:
+            for extension, directory in (("dat", cls.MIRROR_DATA_DIR), ("sln", cls.MIRROR_SOLUTION_DIR)):
+                if extension == "sln" and not solutions:
+                    continue
+                if (directory / f"{problem_name}.{extension}").exists():
+                    continue
+                files.append((problem_name, extension))
+
+        def fetch(file: Tuple[str, str]) -> Optional[str]:
+            try:
+                cls._download(*file, mirror=True)
+                return None
+            except (ValueError, requests.RequestException) as e:
+                # an unknown name or an unreachable file only fails its own entry
+                return str(e)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return {
+                f"{problem_name}.{extension}": error
+                for (problem_name, extension), error in zip(files, executor.map(fetch, files))
+            }
         
     
     @classmethod
-    def load_from_file(cls, filepath: str, problem_name: Optional[str] = None) -> QAPProblem:
+    def load_from_file(cls, filepath: str, problem_name: Optional[str] = None, use_cache: bool = True) -> QAPProblem:
         """
         Load a QAPLIB problem instance from a local file.
         
         Args:
             filepath: Path to the .dat file
             problem_name: Optional name for the problem
+            use_cache: Load the parsed matrices from the binary InstanceCache next to
+                       the file when it is up to date, and fill it after parsing
             
         Returns:
             QAPProblem instance
         """
         try:
-            with open(filepath, 'r') as f:
-                content = f.read()
-            
             if problem_name is None:
                 problem_name = filepath.split('/')[-1].replace('.dat', '')
+
+            if use_cache:
+                problem = InstanceCache.load(filepath, problem_name)
+                if problem is not None:
+                    return problem
+
+            with open(filepath, 'r') as f:
+                content = f.read()
             
-            return cls._parse_qap_data(content, problem_name)
+            problem = cls._parse_qap_data(content, problem_name)
+            if use_cache:
+                InstanceCache.store(filepath, problem)
+            return problem
         except IOError as e:
             raise IOError(f"Failed to read file {filepath}: {e}")
 
+    @classmethod
+    def _parse_tokens(cls, content: str, problem_name: str) -> np.ndarray:
+        """
+        Parse a QAPLIB file as one stream of whitespace (or comma) separated integers.
+
+        Line breaks carry no meaning, so rows wrapped over several lines are read
+        correctly, and the conversion runs inside NumPy rather than per token.
+        """
+        with warnings.catch_warnings():
+            # Older NumPy only warns and truncates when it meets a non-integer token
+            warnings.simplefilter("error", DeprecationWarning)
+            try:
+                return np.fromstring(content.replace(',', ' '), dtype=np.int64, sep=' ')
+            except (ValueError, DeprecationWarning) as e:
+                raise ValueError(f"Failed to parse QAPLIB data for {problem_name}: non-integer token ({e})")
+
     @classmethod
     def _parse_qap_data(cls, content: str, problem_name: str) -> QAPProblem:
         """
         Parse QAPLIB data format.
         
-        QAPLIB format:
-        - First line: problem size (n)
-        - Next n lines: distance matrix
-        - Next n lines: flow matrix
+        QAPLIB format, as a token stream:
+        - First token: problem size (n)
+        - Next n * n tokens: distance matrix, row by row
+        - Next n * n tokens: flow matrix, row by row
         """
-        lines = [line.strip() for line in content.strip().split('\n') if line.strip()]
-        
+        tokens = cls._parse_tokens(content, problem_name)
+        if len(tokens) == 0:
+            raise ValueError(f"Failed to parse QAPLIB data for {problem_name}: file is empty")
+
+        n = int(tokens[0])
+        if n < 1 or len(tokens) != 1 + 2 * n * n:
+            raise ValueError(f"Failed to parse QAPLIB data for {problem_name}: expected {1 + 2 * n * n} numbers for n = {n}, got {len(tokens)}")
+
+        # QAPProblem narrows the matrices to the smallest safe dtype
+        distance_matrix = tokens[1:1 + n * n].reshape(n, n)
+        flow_matrix = tokens[1 + n * n:].reshape(n, n)
+
+        return QAPProblem(distance_matrix, flow_matrix, problem_name)
+
+    @classmethod
+    def _parse_qap_solution(cls, content: str, problem_name: str) -> Tuple[int, List[int]]:
+        """
+        Parse QAPLIB solution format.
+
+        QAPLIB .sln format, as a token stream:
+        - First two tokens: problem size (n) and the optimal or best known cost
+        - Next n tokens: 1-based permutation
+
+        The files do not agree on the orientation of the permutation: for some
+        instances it scores as an assignment of this loader's QAPProblem, for others
+        its inverse does. Score both when the orientation matters.
+
+        Returns:
+            Tuple of (cost, permutation) with the permutation converted to 0-based
+        """
+        tokens = cls._parse_tokens(content, problem_name)
+        if len(tokens) < 2:
+            raise ValueError(f"Failed to parse QAPLIB solution for {problem_name}: missing size and cost")
+
+        n, cost = int(tokens[0]), int(tokens[1])
+        if len(tokens) != 2 + n:
+            raise ValueError(f"Failed to parse QAPLIB solution for {problem_name}: expected {2 + n} numbers for n = {n}, got {len(tokens)}")
+
+        return cost, (tokens[2:] - 1).tolist()
+
+    @classmethod
+    def load_solution_from_file(cls, filepath: str, problem_name: Optional[str] = None) -> Tuple[int, List[int]]:
+        """
+        Load a QAPLIB solution from a local .sln file.
+
+        Returns:
+            Tuple of (cost, 0-based permutation)
+        """
+        if problem_name is None:
+            problem_name = filepath.split('/')[-1].replace('.sln', '')
         try:
-            # First line contains the problem size
-            n = int(lines[0])
-            
-            # Parse distance matrix (next n lines)
-            distance_matrix = []
-            for i in range(1, n + 1):
-                row = [int(x) for x in lines[i].split()]
-                if len(row) != n:
-                    raise ValueError(f"Distance matrix row {i} has incorrect length: expected {n}, got {len(row)}")
-                distance_matrix.append(row)
-            
-            # Parse flow matrix (next n lines)
-            flow_matrix = []
-            for i in range(n + 1, 2 * n + 1):
-                row = [int(x) for x in lines[i].split()]
-                if len(row) != n:
-                    raise ValueError(f"Flow matrix row {i-n} has incorrect length: expected {n}, got {len(row)}")
-                flow_matrix.append(row)
-            
-            # Convert to numpy arrays
-            distance_matrix = np.array(distance_matrix)
-            flow_matrix = np.array(flow_matrix)
-            
-            return QAPProblem(distance_matrix, flow_matrix, problem_name)
-            
-        except (ValueError, IndexError) as e:
-            raise ValueError(f"Failed to parse QAPLIB data for {problem_name}: {e}")
+            with open(filepath, 'r') as f:
+                content = f.read()
+        except IOError as e:
+            raise IOError(f"Failed to read file {filepath}: {e}")
+
+        return cls._parse_qap_solution(content, problem_name)
+
+    @classmethod
+    def load_solution_from_url(cls, problem_name: str, mirror: bool = True) -> Tuple[int, List[int]]:
+        """
+        Load a QAPLIB solution from the online repository, or the mirror like load_from_url.
+
+        Returns:
+            Tuple of (cost, 0-based permutation)
+        """
+        local_path = cls.MIRROR_SOLUTION_DIR / f"{problem_name}.sln"
+        if mirror and local_path.exists():
+            return cls.load_solution_from_file(str(local_path), problem_name)
+
+        content = cls._download(problem_name, "sln", mirror)
+        return cls._parse_qap_solution(content, problem_name)
 
 
     @classmethod
@@ -239,6 +387,13 @@ class QAPLIBLoader:
     @classmethod
     def get_small_problems(cls, max_size: int = 25) -> List[str]:
         """Get list of small problems (good for testing)."""
+        # Sizes of the bundled instances are known exactly from the catalog
+        from src.QAPLoader.InstanceCatalog import InstanceCatalog
+
+        catalog = InstanceCatalog.default()
+        if catalog.entries:
+            return catalog.names(max_size=max_size)
+
         small_problems = []
         for name in cls.POPULAR_INSTANCES.keys():
             # Extract size from problem name if possible
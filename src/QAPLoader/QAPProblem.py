@@ -1,11 +1,21 @@
 from abc import ABC, abstractmethod
-from typing import List, Tuple
+from typing import TYPE_CHECKING, List
 import numpy as np
 
+if TYPE_CHECKING:
+    from src.Population.Population import Population
+
 class QAPProblem:
     """
     Represents a Quadratic Assignment Problem instance.
     """
+
+    # Upper bound on gathered distance entries per chunk in calculate_costs
+    BATCH_CHUNK_ELEMENTS = 1 << 22
+
+    # A matrix with at most this fraction of non-zero entries is evaluated as an edge list
+    SPARSE_DENSITY_THRESHOLD = 0.2
+
     def __init__(self, distance_matrix: np.ndarray, flow_matrix: np.ndarray, name: str = ""):
         """
         Initialize QAP problem instance.
@@ -15,10 +25,14 @@ class QAPProblem:
             flow_matrix: n x n matrix of flows between facilities
             name: optional problem name
         """
-        self.distance_matrix = distance_matrix
-        self.flow_matrix = flow_matrix
+        distance_matrix = np.asarray(distance_matrix)
+        flow_matrix = np.asarray(flow_matrix)
         self.n = len(distance_matrix)
         self.name = name
+
+        # Set by SharedProblem.attach when the matrices live in shared memory
+        self._shared_segment = None
+        self._shared_handle = None
         
         # Validate matrices
         if distance_matrix.shape != (self.n, self.n):
@@ -27,27 +41,364 @@ class QAPProblem:
             raise ValueError("Flow matrix must be square")
         if distance_matrix.shape != flow_matrix.shape:
             raise ValueError("Distance and flow matrices must have same dimensions")
+
+        # Smallest dtype that cannot overflow a full cost, stored C-contiguous and read-only
+        dtype = self.storage_dtype(distance_matrix, flow_matrix)
+        self.distance_matrix = self._read_only(distance_matrix, dtype)
+        self.flow_matrix = self._read_only(flow_matrix, dtype)
+
+        self._select_kernel()
+
+    @staticmethod
+    def storage_dtype(distance_matrix: np.ndarray, flow_matrix: np.ndarray) -> np.dtype:
+        """
+        Pick the storage dtype for a pair of matrices.
+
+        Integer matrices are stored as int32 when max|F| * max|D| * n^2, an upper
+        bound on any cost, fits in it, and as int64 otherwise. Swap deltas reach at
+        most 4(n + 2) * max|F| * max|D|, which only exceeds that bound for n < 6.
+        Anything else is stored as float64.
+        """
+        if not (np.issubdtype(distance_matrix.dtype, np.integer) and np.issubdtype(flow_matrix.dtype, np.integer)):
+            return np.dtype(np.float64)
+        if distance_matrix.size == 0:
+            return np.dtype(np.int32)
+
+        # Python ints, so the bound itself cannot overflow
+        max_distance = int(np.abs(distance_matrix).max())
+        max_flow = int(np.abs(flow_matrix).max())
+        n = len(distance_matrix)
+        bound = max_distance * max_flow * max(n * n, 4 * (n + 2))
+        return np.dtype(np.int32) if bound <= np.iinfo(np.int32).max else np.dtype(np.int64)
+
+    @staticmethod
+    def _read_only(matrix: np.ndarray, dtype: np.dtype) -> np.ndarray:
+        """Return a C-contiguous, non-writeable copy of matrix with the given dtype."""
+        # Already read-only arrays, e.g. memory-mapped cache entries, are used without a copy
+        if matrix.dtype == dtype and matrix.flags.c_contiguous and not matrix.flags.writeable:
+            return matrix
+        matrix = np.array(matrix, dtype=dtype, order="C")
+        matrix.setflags(write=False)
+        return matrix
+
+    def publish(self):
+        """
+        Copy the matrices into shared memory for other processes.
+
+        Returns:
+            The owning SharedProblem; its `problem` pickles as a handle, so workers
+            receiving it attach to the segment instead of copying the matrices
+        """
+        from src.QAPLoader.SharedProblem import SharedProblem
+
+        return SharedProblem(self)
+
+    def __reduce_ex__(self, protocol):
+        # Problems backed by shared memory travel to other processes as a handle
+        if self._shared_handle is not None:
+            from src.QAPLoader.SharedProblem import SharedProblem
+
+            return SharedProblem.attach, (self._shared_handle,)
+        return super().__reduce_ex__(protocol)
+
+    @property
+    def memory_bytes(self) -> int:
+        """Bytes held by the matrices, their transposes and the sparse edge lists."""
+        arrays = [self.distance_matrix, self.flow_matrix]
+        if self.kernel == "dense":
+            arrays += [self._distance_T, self._flow_T]
+        else:
+            arrays += [self._edge_rows, self._edge_cols, self._edge_values,
+                       self._row_ptr, self._col_ptr, self._col_rows, self._col_values]
+
+        # Symmetric matrices share their transpose, count each buffer once
+        unique = {id(array): array for array in arrays}
+        return sum(array.nbytes for array in unique.values())
+
+    def _select_kernel(self) -> None:
+        """
+        Pick the cost kernel from the sparsity of the matrices.
+
+        cost = sum F[i][j] * D[p[i]][p[j]] can be summed over the non-zero flows only,
+        or, with q the inverse of p, over the non-zero distances as
+        sum D[a][b] * F[q[a]][q[b]]. The sparser matrix is kept as a CSR/CSC edge
+        list when its density is below SPARSE_DENSITY_THRESHOLD, which makes full
+        costs O(nnz) and swap deltas O(degree) instead of O(n^2) and O(n).
+
+        Sets `kernel` ("dense", "sparse-flow" or "sparse-distance"), `density`
+        (non-zero fraction of the sparser matrix) and `nnz`.
+        """
+        size = max(1, self.n * self.n)
+        flow_nnz = int(np.count_nonzero(self.flow_matrix))
+        distance_nnz = int(np.count_nonzero(self.distance_matrix))
+
+        if flow_nnz <= distance_nnz:
+            kernel, sparse, dense, self.nnz = "sparse-flow", self.flow_matrix, self.distance_matrix, flow_nnz
+        else:
+            kernel, sparse, dense, self.nnz = "sparse-distance", self.distance_matrix, self.flow_matrix, distance_nnz
+        self.density = self.nnz / size
+
+        if self.density > self.SPARSE_DENSITY_THRESHOLD:
+            self.kernel = "dense"
+            # swap_delta gathers columns, read them as contiguous rows of the transpose
+            self._distance_T = self._transpose(self.distance_matrix)
+            self._flow_T = self._transpose(self.flow_matrix)
+            return
+        self.kernel = kernel
+
+        # The edge list in row-major order doubles as CSR, the transpose's as CSC
+        rows, cols = np.nonzero(sparse)
+        self._edge_rows, self._edge_cols = rows, cols
+        self._edge_values = sparse[rows, cols]
+        self._row_ptr = np.searchsorted(rows, np.arange(self.n + 1))
+
+        cols_t, rows_t = np.nonzero(sparse.T)
+        self._col_ptr = np.searchsorted(cols_t, np.arange(self.n + 1))
+        self._col_rows = rows_t
+        self._col_values = sparse[rows_t, cols_t]
+
+        self._sparse_matrix, self._dense_matrix = sparse, dense
+
+    def _transpose(self, matrix: np.ndarray) -> np.ndarray:
+        """Read-only C-contiguous transpose, or the matrix itself if it is symmetric."""
+        if np.array_equal(matrix, matrix.T):
+            return matrix
+        return self._read_only(matrix.T, matrix.dtype)
+
+    def _batch_costs(self, locations: np.ndarray) -> np.ndarray:
+        """Costs of a validated 0-based (batch, n) location array with the selected kernel."""
+        # Costs are accumulated in 64 bits even when the matrices are stored as int32
+        costs = np.empty(len(locations), dtype=np.result_type(self.flow_matrix, self.distance_matrix, np.int64))
+
+        if self.kernel == "dense":
+            # Gathering D[p][:, p] materialises batch x n x n values, so bound the chunk size
+            chunk = max(1, self.BATCH_CHUNK_ELEMENTS // (self.n * self.n))
+            for start in range(0, len(locations), chunk):
+                block = locations[start:start + chunk]
+                permuted = self.distance_matrix[block[:, :, None], block[:, None, :]]
+                costs[start:start + chunk] = np.einsum("ij,bij->b", self.flow_matrix, permuted)
+            return costs
+
+        chunk = max(1, self.BATCH_CHUNK_ELEMENTS // max(1, self.nnz))
+        for start in range(0, len(locations), chunk):
+            block = locations[start:start + chunk]
+            if self.kernel == "sparse-distance":
+                # Sum over location pairs, so index by the facility placed at each location
+                inverse = np.empty_like(block)
+                inverse[np.arange(len(block))[:, None], block] = np.arange(self.n)
+                block = inverse
+            gathered = self._dense_matrix[block[:, self._edge_rows], block[:, self._edge_cols]]
+            costs[start:start + chunk] = gathered @ self._edge_values
+
+        return costs
     
     def calculate_cost(self, assignment: List[int]) -> int:
         """
         Calculate the total cost of an assignment.
-        
+
+        Kept for backwards compatibility: values are shifted down by one before
+        indexing, exactly like the original loop implementation did, so a
+        0-based assignment is scored with its 0 wrapping to the last location.
+        New code should call `calculate_costs` with an explicit `one_based` flag.
+
         Args:
             assignment: List where assignment[i] is the location assigned to facility i
-                       (0-based indexing)
-        
+                       (1-based indexing)
+
         Returns:
             Total cost of the assignment
         """
         if len(assignment) != self.n:
             raise ValueError(f"Assignment must have length {self.n}, current is {len(assignment)} \n assignment: {assignment}")
-        
-        total_cost = 0
-        for i in range(self.n):
-            for j in range(self.n):
-                total_cost += self.flow_matrix[i][j] * self.distance_matrix[assignment[i]-1][assignment[j]-1]
-        
-        return total_cost
+
+        locations = np.asarray(assignment, dtype=np.intp) - 1
+        # A 0 shifted to -1 wraps to the last location, as negative indexing did
+        locations[locations < 0] += self.n
+        return self._batch_costs(locations[None, :])[0].item()
+
+    def calculate_costs(self, assignments, one_based: bool = False) -> np.ndarray:
+        """
+        Calculate the total costs of a batch of assignments in one call.
+
+        Args:
+            assignments: 2-D array-like of shape (batch, n), row b is an assignment
+                         where assignments[b][i] is the location of facility i
+            one_based: False if locations are numbered 0..n-1 (the LLM / parser
+                       convention), True if they are numbered 1..n (QAPLIB .sln
+                       and the legacy TSP-style traces)
+
+        Returns:
+            1-D array of length batch with the cost of every assignment
+        """
+        locations = np.asarray(assignments, dtype=np.intp)
+        if locations.ndim != 2 or locations.shape[1] != self.n:
+            raise ValueError(f"Assignments must have shape (batch, {self.n}), current is {locations.shape}")
+        if one_based:
+            locations = locations - 1
+        if locations.size and (locations.min() < 0 or locations.max() >= self.n):
+            raise ValueError(f"Assignment values must be in range {int(one_based)}..{self.n - 1 + int(one_based)}")
+
+        return self._batch_costs(locations)
+
+    def swap_delta(self, assignment, i: int, j: int, one_based: bool = False):
+        """
+        Calculate the cost change of exchanging the locations of facilities i and j in O(n).
+
+        Works for asymmetric matrices; nothing is modified. With a sparse kernel only
+        the non-zero entries in the rows and columns of the swapped facilities (or
+        locations) are visited.
+
+        Args:
+            assignment: assignment[k] is the location of facility k
+            i, j: 0-based facility positions to swap
+            one_based: whether the locations in assignment are numbered 1..n
+
+        Returns:
+            cost(swapped assignment) - cost(assignment)
+        """
+        p = np.asarray(assignment, dtype=np.intp)
+        if one_based:
+            p = p - 1
+        if i == j:
+            return 0
+
+        if self.kernel == "sparse-flow":
+            return self._sparse_swap_delta(p, i, j)
+        if self.kernel == "sparse-distance":
+            # Swapping the locations of i and j swaps the facilities at those locations
+            inverse = np.empty_like(p)
+            inverse[p] = np.arange(self.n)
+            return self._sparse_swap_delta(inverse, p[i], p[j])
+
+        F, D = self.flow_matrix, self.distance_matrix
+        FT, DT = self._flow_T, self._distance_T
+        pi, pj = p[i], p[j]
+
+        # Contribution of every other facility k to the rows and columns of i and j
+        delta = (FT[i] - FT[j]) * (DT[pj, p] - DT[pi, p]) + (F[i] - F[j]) * (D[pj, p] - D[pi, p])
+        total = delta.sum() - delta[i] - delta[j]
+
+        # Terms where both facilities are i or j
+        total += (F[i, i] - F[j, j]) * (D[pj, pj] - D[pi, pi])
+        total += (F[i, j] - F[j, i]) * (D[pj, pi] - D[pi, pj])
+
+        return total.item()
+
+    def swap_deltas(self, assignments: np.ndarray, i: np.ndarray, j: np.ndarray) -> np.ndarray:
+        """
+        Vectorized swap_delta: one swap per row of a batch of assignments, in O(batch * n).
+
+        Args:
+            assignments: (batch, n) array of 0-based assignments
+            i, j: length-batch arrays of facility positions, row b swaps i[b] and j[b]
+
+        Returns:
+            int64 (or float64) array with the cost change of every row's swap, 0 where i == j
+        """
+        P = np.asarray(assignments, dtype=np.intp)
+        i = np.asarray(i, dtype=np.intp)
+        j = np.asarray(j, dtype=np.intp)
+        rows = np.arange(len(P))
+        dtype = np.result_type(self.flow_matrix, self.distance_matrix, np.int64)
+        F = self.flow_matrix.astype(dtype, copy=False)
+        D = self.distance_matrix.astype(dtype, copy=False)
+
+        pi, pj = P[rows, i], P[rows, j]
+        # delta[b][k] is the contribution of facility k to the rows and columns of i[b] and j[b]
+        delta = (F[:, i].T - F[:, j].T) * (D[P, pj[:, None]] - D[P, pi[:, None]])
+        delta += (F[i] - F[j]) * (D[pj[:, None], P] - D[pi[:, None], P])
+        total = delta.sum(axis=1) - delta[rows, i] - delta[rows, j]
+
+        # Terms where both facilities are i or j
+        total += (F[i, i] - F[j, j]) * (D[pj, pj] - D[pi, pi])
+        total += (F[i, j] - F[j, i]) * (D[pj, pi] - D[pi, pj])
+
+        total[i == j] = 0
+        return total
+
+    def _sparse_swap_delta(self, perm: np.ndarray, u: int, v: int):
+        """
+        swap_delta on the edge list: the cost is sum S[a][b] * M[perm[a]][perm[b]] with S
+        the sparse matrix and M the dense one, and perm[u], perm[v] are exchanged.
+        """
+        S, M = self._sparse_matrix, self._dense_matrix
+        pu, pv = perm[u], perm[v]
+        total = 0
+
+        # Column terms: edges k -> u and k -> v for every other k
+        for node, sign in ((u, 1), (v, -1)):
+            start, end = self._col_ptr[node], self._col_ptr[node + 1]
+            ks, weights = self._col_rows[start:end], self._col_values[start:end]
+            keep = (ks != u) & (ks != v)
+            pk = perm[ks[keep]]
+            total += sign * (weights[keep] * (M[pk, pv] - M[pk, pu])).sum()
+
+        # Row terms: edges u -> k and v -> k for every other k
+        for node, sign in ((u, 1), (v, -1)):
+            start, end = self._row_ptr[node], self._row_ptr[node + 1]
+            ks, weights = self._edge_cols[start:end], self._edge_values[start:end]
+            keep = (ks != u) & (ks != v)
+            pk = perm[ks[keep]]
+            total += sign * (weights[keep] * (M[pv, pk] - M[pu, pk])).sum()
+
+        # Terms where both ends are u or v
+        total += (S[u, u] - S[v, v]) * (M[pv, pv] - M[pu, pu])
+        total += (S[u, v] - S[v, u]) * (M[pv, pu] - M[pu, pv])
+
+        return total.item()
+
+
+class AssignmentState:
+    """
+    An assignment and its cost, kept up to date through swaps scored with
+    QAPProblem.swap_delta.
+
+    The state belongs to the search using it, so a problem shared between threads
+    or processes is never modified.
+    """
+
+    def __init__(self, problem: QAPProblem, assignment, one_based: bool = False):
+        """
+        Args:
+            problem: QAP problem instance
+            assignment: initial assignment
+            one_based: whether the locations are numbered 1..n
+        """
+        self.problem = problem
+        self.reset(assignment, one_based)
+
+    def reset(self, assignment, one_based: bool = False) -> int:
+        """
+        Replace the assignment and compute its full cost.
+
+        Returns:
+            Cost of the assignment
+        """
+        p = np.array(assignment, dtype=np.intp)
+        if one_based:
+            p -= 1
+        self.assignment = p
+        self.cost = self.problem.calculate_costs(p[None, :])[0].item()
+        return self.cost
+
+    def apply_swap(self, i: int, j: int, delta=None) -> int:
+        """
+        Swap facilities i and j and update the cost incrementally.
+
+        Args:
+            i, j: 0-based facility positions to swap
+            delta: the value of swap_delta for this move if it is already known
+
+        Returns:
+            Cost of the assignment after the swap
+        """
+        if delta is None:
+            delta = self.problem.swap_delta(self.assignment, i, j)
+
+        p = self.assignment
+        p[i], p[j] = p[j], p[i]
+        self.cost += delta
+        return self.cost
 
 
 class QAPPopulationInitializer(ABC):
@@ -57,7 +408,7 @@ class QAPPopulationInitializer(ABC):
     """
 
     @abstractmethod
-    def initialize(self, population_size: int, problem: QAPProblem) -> List[Tuple[List[int], int]]:
+    def initialize(self, population_size: int, problem: QAPProblem) -> "Population":
         """
         Initialize a population for the QAP.
         
@@ -66,8 +417,7 @@ class QAPPopulationInitializer(ABC):
             problem: QAP problem instance
             
         Returns:
-            List of tuples where each tuple contains:
-            - assignment: List of integers representing facility-to-location assignment (0-based)
-            - cost: Total cost of the assignment
+            Population of 0-based facility-to-location assignments and their costs,
+            sorted by cost descendingly
         """
         pass
\ No newline at end of file
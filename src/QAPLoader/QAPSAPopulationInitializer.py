@@ -1,6 +1,7 @@
-from QAPProblem import QAPProblem, QAPPopulationInitializer
-from typing import List, Tuple
-import random
+from src.Population.Population import Population
+from src.QAPLoader.QAPProblem import AssignmentState, QAPProblem, QAPPopulationInitializer
+from src.QAPLoader.SwapNeighborhood import SwapNeighborhood
+from typing import List, Optional, Tuple
 import numpy as np
 
 
@@ -10,10 +11,23 @@ class QAPSAPopulationInitializer(QAPPopulationInitializer):
     Each individual is generated using SA with different cooling rates.
     """
     
-    def __init__(self):
+    def __init__(self, local_search_moves: int = 0, batched: bool = False, seed: Optional[int] = None):
+        """
+        Args:
+            local_search_moves: if > 0, every SA result is polished with up to this
+                                many best-improvement swaps
+            batched: advance all chains together as one (population_size, n) array,
+                     proposing one swap per chain per step, instead of one chain after
+                     another with swap and insert moves
+            seed: seed of the random generator used by both modes
+        """
         self.problem = None
+        self.local_search_moves = local_search_moves
+        self.batched = batched
+        self.seed = seed
+        self.rng = np.random.default_rng(seed)
 
-    def initialize(self, population_size: int, problem: QAPProblem) -> List[Tuple[List[int], int]]:
+    def initialize(self, population_size: int, problem: QAPProblem) -> Population:
         """
         Initialize population using Simulated Annealing with variable cooling rates.
         
@@ -22,7 +36,7 @@ class QAPSAPopulationInitializer(QAPPopulationInitializer):
             problem: QAP problem instance
             
         Returns:
-            List of tuples (assignment, cost)
+            Population of the SA results
         """
         self.problem = problem
         
@@ -30,29 +44,33 @@ class QAPSAPopulationInitializer(QAPPopulationInitializer):
         cooling_rate_range = (0.90, 0.99)
         population = []
 
-        for _ in range(population_size):
-            cooling_rate = random.uniform(*cooling_rate_range)
-            assignment, cost = self._simulated_annealing(cooling_rate=cooling_rate)
+        if self.batched:
+            cooling_rates = self.rng.uniform(*cooling_rate_range, size=population_size)
+            results = self._batched_simulated_annealing(cooling_rates)
+        else:
+            results = (
+                self._simulated_annealing(cooling_rate=self.rng.uniform(*cooling_rate_range))
+                for _ in range(population_size)
+            )
+
+        for assignment, cost in results:
+            if self.local_search_moves > 0:
+                neighborhood = SwapNeighborhood(problem, assignment)
+                cost = neighborhood.local_search(max_moves=self.local_search_moves)
+                assignment = neighborhood.get_assignment()
             population.append((assignment, cost))
 
-        return population
+        return Population.fromIndividuals(population, problem.n)
 
     def _calculate_cost(self, assignment: List[int]) -> int:
-        """Calculate the total cost of a QAP assignment."""
-        return self.problem.calculate_cost(assignment)
-
-    def _swap_facilities(self, assignment: List[int]) -> List[int]:
-        """Generate a neighboring solution by swapping two facility assignments."""
-        new_assignment = assignment.copy()
-        i, j = random.sample(range(len(assignment)), 2)
-        new_assignment[i], new_assignment[j] = new_assignment[j], new_assignment[i]
-        return new_assignment
+        """Calculate the total cost of a 0-based QAP assignment."""
+        return self.problem.calculate_costs([assignment], one_based=False)[0].item()
 
     def _insert_move(self, assignment: List[int]) -> List[int]:
         """Generate a neighboring solution using insert move."""
         new_assignment = assignment.copy()
-        i = random.randint(0, len(assignment) - 1)
-        j = random.randint(0, len(assignment) - 1)
+        i = int(self.rng.integers(len(assignment)))
+        j = int(self.rng.integers(len(assignment)))
         
         if i != j:
             # Remove facility at position i and insert at position j
@@ -61,13 +79,6 @@ class QAPSAPopulationInitializer(QAPPopulationInitializer):
         
         return new_assignment
 
-    def _get_neighbor(self, assignment: List[int]) -> List[int]:
-        """Get a random neighbor using either swap or insert move."""
-        if random.random() < 0.7:  # 70% chance for swap, 30% for insert
-            return self._swap_facilities(assignment)
-        else:
-            return self._insert_move(assignment)
-
     def _simulated_annealing(self, cooling_rate: float = 0.95, 
                            initial_temperature: float = 1000, 
                            max_iterations: int = 1000) -> Tuple[List[int], int]:
@@ -84,11 +95,11 @@ class QAPSAPopulationInitializer(QAPPopulationInitializer):
         """
 
         n = self.problem.n
-        
-        # Start with random assignment
-        current_assignment = list(range(n))
-        random.shuffle(current_assignment)
-        current_cost = self._calculate_cost(current_assignment)
+
+        # Start with random assignment, tracked by a state so swaps are scored incrementally
+        current_assignment = self.rng.permutation(n).tolist()
+        current = AssignmentState(self.problem, current_assignment)
+        current_cost = current.cost
 
         # Track best solution found
         best_assignment = current_assignment.copy()
@@ -96,18 +107,28 @@ class QAPSAPopulationInitializer(QAPPopulationInitializer):
         temperature = initial_temperature
 
         for iteration in range(max_iterations):
-            # Generate neighbor
-            new_assignment = self._get_neighbor(current_assignment)
-            new_cost = self._calculate_cost(new_assignment)
+            # Swap moves are scored in O(n), insert moves still need a full evaluation
+            if self.rng.random() < 0.7:  # 70% chance for swap, 30% for insert
+                # Two distinct positions
+                i = int(self.rng.integers(n))
+                j = (i + int(self.rng.integers(1, n))) % n
+                delta = self.problem.swap_delta(current.assignment, i, j)
+                new_assignment = None
+            else:
+                new_assignment = self._insert_move(current.assignment.tolist())
+                delta = self._calculate_cost(new_assignment) - current_cost
+            new_cost = current_cost + delta
 
             # Accept or reject the new solution
-            if new_cost < current_cost or random.random() < np.exp((current_cost - new_cost) / temperature):
-                current_assignment = new_assignment
-                current_cost = new_cost
+            if new_cost < current_cost or self.rng.random() < np.exp((current_cost - new_cost) / temperature):
+                if new_assignment is None:
+                    current_cost = current.apply_swap(i, j, delta)
+                else:
+                    current_cost = current.reset(new_assignment)
 
                 # Update best solution if necessary
                 if new_cost < best_cost:
-                    best_assignment = new_assignment.copy()
+                    best_assignment = current.assignment.tolist()
                     best_cost = new_cost
 
             # Cool down
@@ -118,4 +139,51 @@ class QAPSAPopulationInitializer(QAPPopulationInitializer):
                 break
 
         return best_assignment, best_cost
-    
\ No newline at end of file
+    
+
+    def _batched_simulated_annealing(self, cooling_rates: np.ndarray,
+                                     initial_temperature: float = 1000,
+                                     max_iterations: int = 1000) -> List[Tuple[List[int], int]]:
+        """
+        Run one SA chain per cooling rate, all advanced together.
+
+        Every step proposes one random swap per chain and scores all of them with a
+        single QAPProblem.swap_deltas call; acceptance and cooling stay per chain.
+
+        Returns:
+            List of (best_assignment, best_cost), one per cooling rate
+        """
+        n = self.problem.n
+        chains = len(cooling_rates)
+        rows = np.arange(chains)
+
+        current = self.rng.permuted(np.tile(np.arange(n), (chains, 1)), axis=1)
+        current_costs = self.problem.calculate_costs(current)
+        best = current.copy()
+        best_costs = current_costs.copy()
+        temperatures = np.full(chains, float(initial_temperature))
+
+        for iteration in range(max_iterations):
+            # Two distinct positions per chain
+            i = self.rng.integers(0, n, size=chains)
+            j = (i + self.rng.integers(1, n, size=chains)) % n
+            deltas = self.problem.swap_deltas(current, i, j)
+
+            # Metropolis acceptance, exp is only evaluated where it matters
+            with np.errstate(over="ignore"):
+                accept = (deltas < 0) | (self.rng.random(chains) < np.exp(-np.maximum(deltas, 0) / temperatures))
+
+            accepted = rows[accept]
+            ai, aj = i[accept], j[accept]
+            current[accepted, ai], current[accepted, aj] = current[accepted, aj], current[accepted, ai]
+            current_costs[accepted] += deltas[accept]
+
+            improved = current_costs < best_costs
+            best[improved] = current[improved]
+            best_costs[improved] = current_costs[improved]
+
+            temperatures *= cooling_rates
+            if (temperatures < 1e-8).all():
+                break
+
+        return [(assignment.tolist(), cost.item()) for assignment, cost in zip(best, best_costs)]
@@ -0,0 +1,118 @@
+import time
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from src.QAPLoader.QAPProblem import QAPProblem
+from src.QAPLoader.SwapNeighborhood import SwapNeighborhood
+
+
+class RobustTabuSearch:
+    """
+    Taillard's Robust Tabu Search for the QAP.
+
+    Every iteration applies the best allowed 2-swap from the SwapNeighborhood
+    delta matrix. After swapping r and s, putting r back on its old location and s
+    back on its old location is tabu for a tenure drawn uniformly from
+    tenure_range * n. A swap is forbidden only if both of its placements are tabu.
+    A swap is aspired, and preferred over every other move, if it beats the best
+    cost found so far or if one of its placements has not been tabu for
+    aspiration_factor * n^2 iterations, which forces long-term diversification.
+
+    The search is stateful: `reset` starts from an assignment and `search` can be
+    called repeatedly to continue it.
+    """
+
+    def __init__(
+        self,
+        problem: QAPProblem,
+        seed: Optional[int] = None,
+        tenure_range: Tuple[float, float] = (0.9, 1.1),
+        aspiration_factor: float = 5.0,
+    ):
+        """
+        Args:
+            problem: QAP problem instance
+            seed: seed of the random generator for starts and tenures
+            tenure_range: bounds of the tabu tenure as multiples of n
+            aspiration_factor: a placement unused for this many n^2 iterations is aspired
+        """
+        self.problem = problem
+        self.n = problem.n
+        self.rng = np.random.default_rng(seed)
+        self.tenure_bounds = (
+            max(1, int(tenure_range[0] * self.n)),
+            max(1, int(np.ceil(tenure_range[1] * self.n))),
+        )
+        self.aspiration = int(aspiration_factor * self.n * self.n)
+        self._upper = np.triu(np.ones((self.n, self.n), dtype=bool), k=1)
+
+        self.neighborhood = None
+        self.reset()
+
+    def reset(self, assignment=None, one_based: bool = False) -> None:
+        """Start a new search from an assignment, or from a random one."""
+        if assignment is None:
+            assignment = self.rng.permutation(self.n)
+        self.neighborhood = SwapNeighborhood(self.problem, assignment, one_based)
+
+        # tabu[i][k]: iteration until which facility i may not be put back on location k
+        self.tabu = np.zeros((self.n, self.n), dtype=np.int64)
+        self.iteration = 0
+        self.elapsed = 0.0
+
+        self.best_assignment = self.neighborhood.assignment.copy()
+        self.best_cost = self.neighborhood.cost
+
+    def search(self, iterations: int, target_cost: Optional[float] = None) -> int:
+        """
+        Run up to `iterations` more iterations, stopping early once target_cost is reached.
+
+        Returns:
+            Best cost found since the last reset
+        """
+        neighborhood, tabu, upper = self.neighborhood, self.tabu, self._upper
+        start = time.perf_counter()
+
+        for _ in range(iterations):
+            if target_cost is not None and self.best_cost <= target_cost:
+                break
+            self.iteration += 1
+            iteration = self.iteration
+
+            p, delta = neighborhood.assignment, neighborhood.delta
+            # placed[r][s] is the tabu entry of putting r on the location of s
+            placed = tabu[:, p]
+            allowed = ((placed < iteration) | (placed.T < iteration)) & upper
+            forgotten = iteration - self.aspiration
+            aspired = (
+                (placed < forgotten) | (placed.T < forgotten) | (delta < self.best_cost - neighborhood.cost)
+            ) & upper
+
+            if aspired.any():
+                candidates = aspired
+            elif allowed.any():
+                candidates = allowed
+            else:
+                candidates = upper
+            r, s = divmod(int(np.argmin(np.where(candidates, delta, SwapNeighborhood.NO_MOVE))), self.n)
+
+            location_r, location_s = p[r], p[s]
+            neighborhood.apply_move(r, s)
+            tabu[r, location_r] = iteration + self.rng.integers(self.tenure_bounds[0], self.tenure_bounds[1] + 1)
+            tabu[s, location_s] = iteration + self.rng.integers(self.tenure_bounds[0], self.tenure_bounds[1] + 1)
+
+            if neighborhood.cost < self.best_cost:
+                self.best_cost = neighborhood.cost
+                self.best_assignment = neighborhood.assignment.copy()
+
+        self.elapsed += time.perf_counter() - start
+        return self.best_cost
+
+    @property
+    def iterations_per_second(self) -> float:
+        return self.iteration / self.elapsed if self.elapsed > 0 else 0.0
+
+    def get_best_assignment(self, one_based: bool = False) -> List[int]:
+        """Return the best assignment found as a list."""
+        return (self.best_assignment + int(one_based)).tolist()
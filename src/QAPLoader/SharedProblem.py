@@ -0,0 +1,87 @@
+import atexit
+import sys
+from multiprocessing import shared_memory
+from typing import NamedTuple
+
+import numpy as np
+
+from src.QAPLoader.QAPProblem import QAPProblem
+
+
+class SharedProblemHandle(NamedTuple):
+    """Picklable reference to a problem published in shared memory."""
+
+    segment: str
+    n: int
+    dtype: str
+    name: str
+
+
+class SharedProblem:
+    """
+    Owner of a QAPProblem's matrices copied into one shared memory segment.
+
+    The segment holds a (2, n, n) array, distance then flow, in the problem's
+    storage dtype. Workers re-create the problem from `handle` with `attach`
+    without copying the matrices. The owner unlinks the segment on `close`, when
+    used as a context manager, or at interpreter exit, whichever comes first.
+    """
+
+    def __init__(self, problem: QAPProblem):
+        dtype = problem.distance_matrix.dtype
+        size = max(1, 2 * problem.n * problem.n * dtype.itemsize)
+        self._segment = shared_memory.SharedMemory(create=True, size=size)
+
+        matrices = np.ndarray((2, problem.n, problem.n), dtype=dtype, buffer=self._segment.buf)
+        matrices[0] = problem.distance_matrix
+        matrices[1] = problem.flow_matrix
+        del matrices
+
+        self.handle = SharedProblemHandle(self._segment.name, problem.n, dtype.str, problem.name)
+        self.problem = self.attach(self.handle)
+        atexit.register(self.close)
+
+    @staticmethod
+    def attach(handle: SharedProblemHandle) -> QAPProblem:
+        """
+        Re-create a published problem in this process without copying its matrices.
+
+        Processes started through multiprocessing share the owner's resource
+        tracker, so attaching never unlinks the segment. Before Python 3.13 an
+        unrelated process would get its own tracker, which unlinks the segment when
+        that process exits.
+        """
+        if sys.version_info >= (3, 13):
+            segment = shared_memory.SharedMemory(name=handle.segment, track=False)
+        else:
+            segment = shared_memory.SharedMemory(name=handle.segment)
+
+        matrices = np.ndarray((2, handle.n, handle.n), dtype=np.dtype(handle.dtype), buffer=segment.buf)
+        matrices.setflags(write=False)
+
+        problem = QAPProblem(matrices[0], matrices[1], handle.name)
+        # The matrices are views of the segment, which must stay mapped as long as the problem lives
+        problem._shared_segment = segment
+        problem._shared_handle = handle
+        return problem
+
+    def close(self) -> None:
+        """Unmap and unlink the segment; problems attached elsewhere must not be used afterwards."""
+        if self._segment is None:
+            return
+        atexit.unregister(self.close)
+
+        # Drop this process's views first, a mapping with live exports cannot be closed
+        self.problem = None
+        segment, self._segment = self._segment, None
+        try:
+            segment.close()
+        except BufferError:
+            pass
+        segment.unlink()
+
+    def __enter__(self) -> "SharedProblem":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
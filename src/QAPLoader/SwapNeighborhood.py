@@ -0,0 +1,345 @@
+import time
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from src.QAPLoader.QAPProblem import QAPProblem
+
+
+class SwapNeighborhood:
+    """
+    Full 2-swap neighborhood of a QAP assignment.
+
+    Holds delta[i][j], the cost change of exchanging the locations of facilities
+    i and j, for every pair. After a swap of (r, s) the pairs not touching r or s
+    are updated in O(1) each with Taillard's rule, only rows r and s are
+    recomputed in O(n) per entry, so a move costs O(n^2) instead of O(n^3).
+    """
+
+    # Stored on the diagonal so that a swap with itself is never selected
+    NO_MOVE = np.iinfo(np.int64).max
+
+    def __init__(self, problem: QAPProblem, assignment, one_based: bool = False):
+        """
+        Build the delta matrix for an assignment.
+
+        Args:
+            problem: QAP problem instance
+            assignment: assignment[i] is the location of facility i
+            one_based: whether the locations in assignment are numbered 1..n
+        """
+        self.problem = problem
+        self.n = problem.n
+        self.flow = np.asarray(problem.flow_matrix, dtype=np.int64)
+        self.distance = np.asarray(problem.distance_matrix, dtype=np.int64)
+        self.reset(assignment, one_based)
+
+    def reset(self, assignment, one_based: bool = False) -> None:
+        """Replace the current assignment and rebuild the whole delta matrix."""
+        self.assignment = np.array(assignment, dtype=np.intp)
+        if one_based:
+            self.assignment -= 1
+        self.cost = self.problem.calculate_costs(self.assignment[None, :])[0].item()
+
+        self.delta = np.empty((self.n, self.n), dtype=np.int64)
+        permuted = self.distance[np.ix_(self.assignment, self.assignment)]
+        for i in range(self.n):
+            self.delta[i] = self._row_deltas(permuted, i)
+        np.fill_diagonal(self.delta, self.NO_MOVE)
+
+    def _row_deltas(self, permuted: np.ndarray, i: int) -> np.ndarray:
+        """
+        Deltas of swapping facility i with every facility j, in O(n^2) NumPy work.
+
+        permuted[k][l] is the distance between the locations of facilities k and l.
+        """
+        F, P = self.flow, permuted
+
+        # Sum over every k of the row/column terms, including k == i and k == j
+        cols = ((F[:, i][None, :] - F.T) * (P.T - P[:, i][None, :])).sum(axis=1)
+        rows = ((F[i, :][None, :] - F) * (P - P[i, :][None, :])).sum(axis=1)
+        deltas = cols + rows
+
+        # Remove the k == i and k == j terms, then add the exact pair terms
+        F_ii, F_ij, F_ji, F_jj = F[i, i], F[i, :], F[:, i], np.diag(F)
+        P_ii, P_ij, P_ji, P_jj = P[i, i], P[i, :], P[:, i], np.diag(P)
+        deltas -= (F_ii - F_ij) * (P_ij - P_ii) + (F_ii - F_ji) * (P_ji - P_ii)
+        deltas -= (F_ji - F_jj) * (P_jj - P_ji) + (F_ij - F_jj) * (P_jj - P_ij)
+        deltas += (F_ii - F_jj) * (P_jj - P_ii) + (F_ij - F_ji) * (P_ji - P_ij)
+
+        deltas[i] = self.NO_MOVE
+        return deltas
+
+    def best_move(self) -> Tuple[int, int, int]:
+        """Return (i, j, delta) of the swap with the lowest delta, improving or not."""
+        flat = int(np.argmin(self.delta))
+        i, j = divmod(flat, self.n)
+        return min(i, j), max(i, j), self.delta[i, j].item()
+
+    def first_improving_move(self) -> Optional[Tuple[int, int, int]]:
+        """Return (i, j, delta) of the first improving swap in row-major order, or None."""
+        improving = (self.delta < 0).ravel()
+        flat = int(np.argmax(improving))
+        if not improving[flat]:
+            return None
+        # The mirror of a lower-triangle entry is met first, so i < j here
+        i, j = divmod(flat, self.n)
+        return i, j, self.delta[i, j].item()
+
+    def apply_move(self, r: int, s: int) -> int:
+        """
+        Swap facilities r and s and update the delta matrix incrementally.
+
+        Returns:
+            Cost of the assignment after the swap
+        """
+        if r == s:
+            return self.cost
+        F, D, p = self.flow, self.distance, self.assignment
+
+        self.cost += self.delta[r, s].item()
+        p[r], p[s] = p[s], p[r]
+        loc_r, loc_s = p[r], p[s]
+
+        # Taillard's update for every pair (u, v) disjoint from {r, s}, using the new assignment
+        A1 = F[r, :] - F[s, :]
+        A2 = F[:, r] - F[:, s]
+        B1 = D[loc_s, p] - D[loc_r, p]
+        B2 = D[p, loc_s] - D[p, loc_r]
+        self.delta += (A1[:, None] - A1[None, :]) * (B1[:, None] - B1[None, :])
+        self.delta += (A2[:, None] - A2[None, :]) * (B2[:, None] - B2[None, :])
+
+        # Pairs touching r or s are recomputed exactly
+        permuted = D[np.ix_(p, p)]
+        for k in (r, s):
+            row = self._row_deltas(permuted, k)
+            self.delta[k, :] = row
+            self.delta[:, k] = row
+        np.fill_diagonal(self.delta, self.NO_MOVE)
+
+        return self.cost
+
+    def local_search(
+        self, max_moves: Optional[int] = None, first_improvement: bool = False
+    ) -> int:
+        """
+        Apply improving swaps until a local optimum or max_moves is reached.
+
+        Returns:
+            Cost of the final assignment
+        """
+        moves = 0
+        while max_moves is None or moves < max_moves:
+            if first_improvement:
+                move = self.first_improving_move()
+                if move is None:
+                    break
+            else:
+                move = self.best_move()
+                if move[2] >= 0:
+                    break
+            self.apply_move(move[0], move[1])
+            moves += 1
+
+        return self.cost
+
+    def get_assignment(self, one_based: bool = False) -> List[int]:
+        """Return the current assignment as a list."""
+        return (self.assignment + int(one_based)).tolist()
+
+
+class BatchSwapNeighborhood:
+    """
+    2-swap neighborhoods of a batch of assignments, advanced together.
+
+    delta[b][i][j] is the cost change of exchanging the locations of facilities i
+    and j in assignment b. The whole tensor is built with batched matrix products.
+    A move applied to several assignments at once updates their deltas with
+    Taillard's rule and recomputes the two touched rows exactly with batched
+    matrix-vector products, in O(n^2) NumPy work per assignment like SwapNeighborhood.
+    """
+
+    NO_MOVE = SwapNeighborhood.NO_MOVE
+
+    def __init__(self, problem: QAPProblem, assignments, one_based: bool = False):
+        """
+        Args:
+            problem: QAP problem instance
+            assignments: (batch, n) array-like, row b is an assignment
+            one_based: whether the locations are numbered 1..n
+        """
+        self.problem = problem
+        self.n = problem.n
+        self.flow = np.asarray(problem.flow_matrix, dtype=np.int64)
+        self.distance = np.asarray(problem.distance_matrix, dtype=np.int64)
+        self._flow_diagonal = np.diag(self.flow).copy()
+
+        self.assignments = np.array(assignments, dtype=np.intp).reshape(-1, self.n)
+        if one_based:
+            self.assignments -= 1
+        self.costs = self.problem.calculate_costs(self.assignments).astype(np.int64)
+
+        # permuted[b][k][l] is the distance between the locations of facilities k and l in assignment b
+        self.permuted = self.distance[self.assignments[:, :, None], self.assignments[:, None, :]]
+
+        F, P = self.flow, self.permuted
+        # Sums over every k of both terms of the swap delta, as batched products
+        A = np.matmul(F.T, P)
+        C = np.matmul(F, P.transpose(0, 2, 1))
+        dA = np.diagonal(A, axis1=1, axis2=2)
+        dC = np.diagonal(C, axis1=1, axis2=2)
+        delta = A - dA[:, :, None] - dA[:, None, :] + A.transpose(0, 2, 1)
+        delta += C - dC[:, :, None] - dC[:, None, :] + C.transpose(0, 2, 1)
+
+        # Remove the k == i and k == j terms, then add the exact pair terms
+        Fd, Pd = self._flow_diagonal, np.diagonal(P, axis1=1, axis2=2)
+        Fi, Fj = Fd[:, None], Fd[None, :]
+        Pi, Pj = Pd[:, :, None], Pd[:, None, :]
+        PT = P.transpose(0, 2, 1)
+        delta -= (Fi - F) * (P - Pi) + (Fi - F.T) * (PT - Pi)
+        delta -= (F.T - Fj) * (Pj - PT) + (F - Fj) * (Pj - P)
+        delta += (Fi - Fj) * (Pj - Pi) + (F - F.T) * (PT - P)
+
+        self.delta = delta
+        self._clear_diagonal(np.arange(len(self.assignments)))
+
+    def _clear_diagonal(self, members: np.ndarray) -> None:
+        diagonal = np.arange(self.n)
+        self.delta[members[:, None], diagonal[None, :], diagonal[None, :]] = self.NO_MOVE
+
+    def _row_deltas(self, P: np.ndarray, i: np.ndarray) -> np.ndarray:
+        """
+        Exact deltas of swapping facility i[b] with every facility j in each assignment b.
+
+        The sums over k of SwapNeighborhood._row_deltas are expanded into
+        matrix-vector products, so no (batch, n, n) temporary is created.
+        """
+        F, Fd = self.flow, self._flow_diagonal
+        batch = np.arange(len(i))
+
+        F_ij, F_ji = F[i, :], F[:, i].T
+        P_ij, P_ji = P[batch, i, :], P[batch, :, i]
+        F_ii, P_ii = Fd[i][:, None], P[batch, i, i][:, None]
+        F_jj, P_jj = Fd[None, :], np.diagonal(P, axis1=1, axis2=2)
+
+        # sum_k (F[k,i] - F[k,j]) * (P[k,j] - P[k,i])
+        cols = np.einsum("bk,bkj->bj", F_ji, P) - np.einsum("bk,bk->b", F_ji, P_ji)[:, None]
+        cols -= np.einsum("kj,bkj->bj", F, P) - P_ji @ F
+        # sum_k (F[i,k] - F[j,k]) * (P[j,k] - P[i,k])
+        rows = np.einsum("bjk,bk->bj", P, F_ij) - np.einsum("bk,bk->b", F_ij, P_ij)[:, None]
+        rows -= np.einsum("jk,bjk->bj", F, P) - P_ij @ F.T
+        deltas = cols + rows
+
+        # Remove the k == i and k == j terms, then add the exact pair terms
+        deltas -= (F_ii - F_ij) * (P_ij - P_ii) + (F_ii - F_ji) * (P_ji - P_ii)
+        deltas -= (F_ji - F_jj) * (P_jj - P_ji) + (F_ij - F_jj) * (P_jj - P_ij)
+        deltas += (F_ii - F_jj) * (P_jj - P_ii) + (F_ij - F_ji) * (P_ji - P_ij)
+        return deltas
+
+    def select_moves(self, first_improvement: bool = False) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(r, s, delta) of the chosen swap of every assignment, best or first improving in row-major order."""
+        flat = self.delta.reshape(len(self.assignments), -1)
+        if first_improvement:
+            improving = flat < 0
+            chosen = np.argmax(improving, axis=1)
+            # without an improving swap fall back to the best one, which is not improving either
+            none = ~improving[np.arange(len(flat)), chosen]
+            chosen[none] = np.argmin(flat[none], axis=1)
+        else:
+            chosen = np.argmin(flat, axis=1)
+        r, s = np.divmod(chosen, self.n)
+        return r, s, flat[np.arange(len(flat)), chosen]
+
+    def apply_moves(self, members: np.ndarray, r: np.ndarray, s: np.ndarray) -> None:
+        """Swap facilities r[k] and s[k] of assignment members[k] and update their deltas."""
+        if len(members) == 0:
+            return
+        F, D = self.flow, self.distance
+        batch = np.arange(len(members))
+        # Work in place when every assignment moves, on copies of the moving ones otherwise
+        everyone = len(members) == len(self.assignments)
+
+        self.costs[members] += self.delta[members, r, s]
+        p = self.assignments if everyone else self.assignments[members]
+        P = self.permuted if everyone else self.permuted[members]
+        delta = self.delta if everyone else self.delta[members]
+
+        p[batch, r], p[batch, s] = p[batch, s], p[batch, r].copy()
+        P[batch, r, :], P[batch, s, :] = P[batch, s, :], P[batch, r, :].copy()
+        P[batch, :, r], P[batch, :, s] = P[batch, :, s], P[batch, :, r].copy()
+        loc_r, loc_s = p[batch, r], p[batch, s]
+
+        # Taillard's update for every pair disjoint from {r, s}, using the new assignments
+        term = np.empty_like(delta)
+        factor = np.empty_like(delta)
+        for a, b in (
+            (F[r, :] - F[s, :], D[loc_s[:, None], p] - D[loc_r[:, None], p]),
+            (F[:, r].T - F[:, s].T, D[p, loc_s[:, None]] - D[p, loc_r[:, None]]),
+        ):
+            np.subtract(a[:, :, None], a[:, None, :], out=term)
+            np.subtract(b[:, :, None], b[:, None, :], out=factor)
+            term *= factor
+            delta += term
+
+        # Pairs touching r or s are recomputed exactly
+        for k in (r, s):
+            row = self._row_deltas(P, k)
+            delta[batch, k, :] = row
+            delta[batch, :, k] = row
+
+        if not everyone:
+            self.assignments[members] = p
+            self.permuted[members] = P
+            self.delta[members] = delta
+        self._clear_diagonal(members)
+
+    def local_search(self, max_moves: Optional[int] = None, first_improvement: bool = False) -> np.ndarray:
+        """
+        Apply improving swaps to every assignment until all are local optima or max_moves is reached.
+
+        Returns:
+            Number of swaps applied to every assignment
+        """
+        moves = np.zeros(len(self.assignments), dtype=np.int64)
+        while max_moves is None or moves.max(initial=0) < max_moves:
+            r, s, deltas = self.select_moves(first_improvement)
+            members = np.flatnonzero(deltas < 0)
+            if len(members) == 0:
+                break
+            self.apply_moves(members, r[members], s[members])
+            moves[members] += 1
+
+        return moves
+
+    def get_assignments(self, one_based: bool = False) -> List[List[int]]:
+        """Return the current assignments as lists."""
+        return (self.assignments + int(one_based)).tolist()
+
+
+def benchmark_swap_neighborhood(filepaths: List[str], moves: int = 1000) -> None:
+    """Print neighborhood build time and applied best-improvement moves per second."""
+    from src.QAPLoader.QAPLibLoader import QAPLIBLoader
+
+    for filepath in filepaths:
+        try:
+            problem = QAPLIBLoader.load_from_file(filepath)
+        except Exception as e:
+            print(f"Error loading problem {filepath}: {e}")
+            continue
+
+        start = time.perf_counter()
+        neighborhood = SwapNeighborhood(problem, np.random.permutation(problem.n))
+        build_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(moves):
+            i, j, _ = neighborhood.best_move()
+            neighborhood.apply_move(i, j)
+        elapsed = time.perf_counter() - start
+
+        print(f"{problem.name} (n={problem.n}): build {build_time:.4f}s, "
+              f"{moves / elapsed:.0f} moves/s over {moves} moves")
+
+
+if __name__ == "__main__":
+    benchmark_swap_neighborhood(["qapdata/tai50a.dat", "qapdata/sko100a.dat"])
@@ -0,0 +1,120 @@
+import threading
+import time
+
+from src.Population.Population import Population
+from src.QAPLoader.QAPProblem import QAPProblem
+from src.QAPLoader.RobustTabuSearch import RobustTabuSearch
+
+
+class BackgroundSearch:
+    """
+    Robust tabu search on the elite individuals while an LLM request is in flight.
+
+    `start` launches a thread that advances one search per elite in turns of n
+    iterations; `finish` stops it once the response has arrived and returns the
+    best assignment of every search that improved on its elite. The thread also
+    stops on its own after latency_fraction times the moving average of the
+    observed request latencies, so a slow or retried request does not keep a core
+    busy indefinitely. The first generation has no estimate and only stops on
+    `finish`. The model call releases the GIL while it waits, so the thread gets
+    the CPU for free.
+    """
+
+    def __init__(
+        self,
+        problem: QAPProblem,
+        elites: int = 3,
+        latency_fraction: float = 1.0,
+        smoothing: float = 0.3,
+        seed: int | None = None,
+    ):
+        """
+        Args:
+            problem: QAP problem instance
+            elites: number of best individuals searched from
+            latency_fraction: budget of a generation as a multiple of the expected latency
+            smoothing: weight of the newest latency in the moving average
+            seed: seed of the searches' random generators
+        """
+        self.problem = problem
+        self.elites = max(1, elites)
+        self.latency_fraction = latency_fraction
+        self.smoothing = smoothing
+        self.searches = [
+            RobustTabuSearch(problem, seed=None if seed is None else seed + k)
+            for k in range(self.elites)
+        ]
+
+        """ Moving average of the observed request latency, None before the first request """
+        self.expectedLatency: float | None = None
+
+        """ Iterations and busy time of the last generation """
+        self.lastRunStats: dict | None = None
+
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._starts: list[int] = []
+
+    @property
+    def budget(self) -> float | None:
+        """Seconds the thread may search this generation, None for no limit."""
+        if self.expectedLatency is None:
+            return None
+        return self.latency_fraction * self.expectedLatency
+
+    def start(self, population: Population) -> None:
+        """Start searching from the best individuals of a population."""
+        elites = population[-len(self.searches):]
+        self._starts = []
+        for search, (trace, length) in zip(self.searches, elites):
+            search.reset(trace)
+            self._starts.append(search.best_cost)
+
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, args=(len(elites), self.budget), daemon=True
+        )
+        self._thread.start()
+
+    def _run(self, active: int, budget: float | None) -> None:
+        start = time.perf_counter()
+        while not self._stop.is_set():
+            if budget is not None and time.perf_counter() - start >= budget:
+                break
+            for search in self.searches[:active]:
+                search.search(self.problem.n)
+                if self._stop.is_set():
+                    break
+
+    def finish(self, latency: float) -> Population:
+        """
+        Stop the search, record the latency of the request it overlapped and
+        return the improved individuals.
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+        self.expectedLatency = (
+            latency
+            if self.expectedLatency is None
+            else self.smoothing * latency + (1 - self.smoothing) * self.expectedLatency
+        )
+
+        active = self.searches[: len(self._starts)]
+        self.lastRunStats = {
+            "iterations": sum(search.iteration for search in active),
+            "busy_time": sum(search.elapsed for search in active),
+            "latency": latency,
+        }
+        improved = [
+            search
+            for search, startCost in zip(active, self._starts)
+            if search.best_cost < startCost
+        ]
+        return Population(
+            [search.best_assignment for search in improved],
+            [search.best_cost for search in improved],
+            self.problem.n,
+        )
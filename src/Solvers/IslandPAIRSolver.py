@@ -0,0 +1,229 @@
+import queue
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import Manager
+
+import numpy as np
+
+from src.ExperimentDataManager import ExperimentDataManager
+from src.Models.Model import Model
+from src.PopulationInitializers.PopulationInitializer import PopulationInitializer
+from src.Population.Population import Population
+from src.QAPLoader.QAPProblem import QAPProblem
+from src.Solvers.LLMTSPSolver import LLMTSPSolver
+from src.Solvers.PAIRSolver import PAIRSolver
+
+
+class _PresetInitializer(PopulationInitializer):
+    """Hands an island its share of the population built by the parent process."""
+
+    def __init__(self, population: Population):
+        self.population = population
+
+    def initialize(self, population_size: int, problem: QAPProblem) -> Population:
+        return self.population
+
+
+class _IslandSolver(PAIRSolver):
+    """PAIRSolver that sends its elites to other islands and takes in theirs between generations."""
+
+    def __init__(
+        self,
+        model: Model,
+        population_initializer: PopulationInitializer,
+        index: int,
+        targets: list[int],
+        inboxes: list,
+        stopEvent,
+        migrationInterval: int,
+        migrationSize: int,
+        **pairKwargs,
+    ):
+        super().__init__(model, population_initializer, **pairKwargs)
+        self.index = index
+        self.targets = targets
+        self.inboxes = inboxes
+        self.stopEvent = stopEvent
+        self.migrationInterval = migrationInterval
+        self.migrationSize = migrationSize
+
+        """ Individuals sent and received over the run """
+        self.emigrants = 0
+        self.immigrants = 0
+
+    def solve(self, expDataManager: ExperimentDataManager) -> tuple[list[int], float]:
+        bestTrace, generation = super().solve(expDataManager)
+
+        # an island finishing early reached the optimum or the lower bound, the others can stop
+        if generation < self.MAX_GENERATIONS:
+            self.stopEvent.set()
+        return bestTrace, generation
+
+    def _onGeneration(
+        self, generation: int, currentPopulation: Population
+    ) -> Population | None:
+        if self.stopEvent.is_set():
+            return None
+
+        if generation % self.migrationInterval == 0:
+            elites = currentPopulation[-self.migrationSize:]
+            for target in self.targets:
+                self.inboxes[target].put(elites)
+                self.emigrants += len(elites)
+
+        # migration is asynchronous, islands never wait for each other
+        arrivals = []
+        while True:
+            try:
+                arrivals.append(self.inboxes[self.index].get_nowait())
+            except queue.Empty:
+                break
+
+        migrants = Population.concatenate(arrivals, currentPopulation.n).difference(
+            currentPopulation
+        )
+        if not len(migrants):
+            return currentPopulation
+        self.immigrants += len(migrants)
+        return PAIRSolver._combinePopulations(
+            currentPopulation,
+            migrants,
+            len(currentPopulation),
+            self.diversity_selector,
+        )
+
+
+def _runIsland(solver: _IslandSolver, dataArgs: tuple) -> tuple:
+    """Worker entry point: run one island with its own experiment files."""
+    expDataManager = ExperimentDataManager(*dataArgs)
+    start = time.perf_counter()
+    bestTrace, generation = solver.solve(expDataManager)
+    return (
+        solver.bestIndividual,
+        generation,
+        time.perf_counter() - start,
+        solver.emigrants,
+        solver.immigrants,
+    )
+
+
+class IslandPAIRSolver(LLMTSPSolver):
+    """
+    Runs several PAIR populations, the islands, in separate processes.
+
+    Every island has its own initial temperature and optionally its own model.
+    Each migration_interval generations it sends its migration_size best
+    individuals to its neighbours in the topology: "ring" sends to the next
+    island, "complete" to all others. Received individuals replace the worst ones.
+    The initial population is built once for all islands and dealt out
+    round-robin, so each island starts with a spread of costs. Every island writes
+    its own iteration CSV and log next to the experiment's, with the same
+    timestamp and the solver name suffixed with _island<k>. The run stops when any
+    island reaches the optimum or the lower bound.
+    """
+
+    TOPOLOGIES = ("ring", "complete")
+
+    def __init__(
+        self,
+        model: Model,
+        population_initializer: PopulationInitializer,
+        islands: int = 4,
+        models: list[Model] | None = None,
+        temperatures: list[float] | None = None,
+        migration_interval: int = 10,
+        migration_size: int = 2,
+        topology: str = "ring",
+        **pairKwargs,
+    ):
+        """
+        Args:
+            islands: number of populations, one process each
+            models: model of every island, cycled if shorter, defaults to model
+            temperatures: initial temperature of every island, defaults to a spread from 2 to 1
+            migration_interval: generations between two emigrations of an island
+            migration_size: best individuals sent per emigration
+            topology: "ring" or "complete"
+            pairKwargs: forwarded to every island's PAIRSolver
+        """
+        super().__init__(model, population_initializer)
+        if topology not in self.TOPOLOGIES:
+            raise ValueError(f"topology must be one of {self.TOPOLOGIES}, got {topology!r}")
+
+        self.islands = max(1, islands)
+        self.models = models or [model]
+        self.temperatures = temperatures or [
+            round(t, 3) for t in np.linspace(2, 1, self.islands)
+        ]
+        self.migration_interval = max(1, migration_interval)
+        self.migration_size = max(1, migration_size)
+        self.topology = topology
+        self.pairKwargs = pairKwargs
+
+    def _targets(self, index: int) -> list[int]:
+        if self.islands == 1:
+            return []
+        if self.topology == "ring":
+            return [(index + 1) % self.islands]
+        return [k for k in range(self.islands) if k != index]
+
+    def solve(self, expDataManager: ExperimentDataManager) -> tuple[list[int], float]:
+        problem: QAPProblem = expDataManager.problem
+        populationSize = PAIRSolver.POPULATION_SIZE
+
+        """ Initialize every island's population in one call, then deal it out """
+        initializationStart = time.perf_counter()
+        population = self.population_initializer.initialize(
+            populationSize * self.islands, problem
+        )
+        expDataManager.logInitialization(
+            time.perf_counter() - initializationStart,
+            len(population),
+            getattr(self.population_initializer, "lastRunStats", None),
+        )
+
+        with Manager() as manager:
+            inboxes = [manager.Queue() for _ in range(self.islands)]
+            stopEvent = manager.Event()
+
+            with ProcessPoolExecutor(max_workers=self.islands) as executor:
+                futures = []
+                for k in range(self.islands):
+                    model = self.models[k % len(self.models)]
+                    solver = _IslandSolver(
+                        model,
+                        _PresetInitializer(population[k::self.islands]),
+                        k,
+                        self._targets(k),
+                        inboxes,
+                        stopEvent,
+                        self.migration_interval,
+                        self.migration_size,
+                        initial_temperature=self.temperatures[k % len(self.temperatures)],
+                        **self.pairKwargs,
+                    )
+                    dataArgs = (
+                        str(expDataManager.problemFilePath),
+                        expDataManager.problemName,
+                        model.modelName,
+                        expDataManager.optimalDistance,
+                        f"{expDataManager.solverName}_island{k}",
+                        expDataManager.timestamp,
+                    )
+                    futures.append(executor.submit(_runIsland, solver, dataArgs))
+                results = [future.result() for future in futures]
+
+        for k, (best, generation, wallTime, emigrants, immigrants) in enumerate(results):
+            expDataManager.logIsland(k, best.cost, generation, wallTime, emigrants, immigrants)
+
+        bestIsland = min(range(self.islands), key=lambda k: results[k][0].cost)
+        (bestTrace, bestLength), generation = results[bestIsland][0], results[bestIsland][1]
+        bestTrace = bestTrace.tolist()
+        expDataManager.saveSolution(
+            bestTrace,
+            bestLength,
+            expDataManager.optimalDistance,
+            PAIRSolver._calculateOptimalityGap(bestLength, expDataManager.optimalDistance),
+            generation if generation < PAIRSolver.MAX_GENERATIONS else "None",
+        )
+        return bestTrace, max(result[1] for result in results)
@@ -1,47 +1,119 @@
+import asyncio
 import time
 
 import numpy as np
 
+from src.QAPLoader.CostCache import CostCache
+from src.QAPLoader.QAPBounds import QAPBounds
 from src.QAPLoader.QAPProblem import QAPProblem
+from src.QAPLoader.SwapNeighborhood import BatchSwapNeighborhood
 from src.ExperimentDataManager import ExperimentDataManager
 from src.Models.Model import Model
+from src.PopulationInitializers.DiversitySelector import DiversitySelector
 from src.PopulationInitializers.PopulationInitializer import PopulationInitializer
+from src.Population.Population import Individual, Population
 from src.PromptResponseManager.PromptResponseManager import (
     PromptResponseManager as PRManager,
 )
+from src.Solvers.BackgroundSearch import BackgroundSearch
 from src.Solvers.LLMTSPSolver import LLMTSPSolver
 
 
 class PAIRSolver(LLMTSPSolver):
-    def __init__(self, model: Model, population_initializer: PopulationInitializer):
+    """ Set the maximum number of generations """
+    MAX_GENERATIONS = 250
+
+    """ Initial population size, grows when the search stalls """
+    POPULATION_SIZE = 25
+
+    def __init__(
+        self,
+        model: Model,
+        population_initializer: PopulationInitializer,
+        local_search_moves: int = 0,
+        local_search_first_improvement: bool = False,
+        cost_cache_capacity: int = 10000,
+        diversity_selector: DiversitySelector | None = None,
+        fan_out: int = 1,
+        max_concurrency: int = 4,
+        split_parents: bool = False,
+        initial_temperature: float = 2,
+        background_search: bool = False,
+        background_elites: int = 3,
+    ):
         super().__init__(model, population_initializer)
 
         self.population_initializer = population_initializer
 
+        """ Best-improvement swaps applied to every LLM offspring, 0 disables it """
+        self.local_search_moves = local_search_moves
+        self.local_search_first_improvement = local_search_first_improvement
+
+        """ Offspring costs remembered across generations, 0 disables the cache """
+        self.cost_cache_capacity = cost_cache_capacity
+        self.costCache: CostCache | None = None
+
+        """ Survivor selection balancing cost and diversity, None keeps the cheapest """
+        self.diversity_selector = diversity_selector
+
+        """ Offspring are requested through fan_out smaller prompts sent concurrently,
+        at most max_concurrency in flight; split_parents gives every prompt its own
+        share of the population (always including the best individual) """
+        self.fan_out = max(1, fan_out)
+        self.max_concurrency = max(1, max_concurrency)
+        self.split_parents = split_parents
+
+        """ Model temperature of the first generation """
+        self.initial_temperature = initial_temperature
+
+        """ Tabu search on the background_elites best individuals while the model is queried """
+        self.background_search = background_search
+        self.background_elites = background_elites
+        self.backgroundSearch: BackgroundSearch | None = None
+
+        """ Individuals dropped as duplicates while building the current generation """
+        self.generationDuplicates = 0
+
+        """ Best (assignment, cost) of the last solve call """
+        self.bestIndividual: Individual | None = None
+
     def solve(self, expDataManager: ExperimentDataManager) -> tuple[list[int], float]:
         problem: QAPProblem = expDataManager.problem
 
+        if self.cost_cache_capacity > 0:
+            self.costCache = CostCache(problem, self.cost_cache_capacity)
+
+        if self.background_search:
+            self.backgroundSearch = BackgroundSearch(problem, self.background_elites)
+
         """ Temperature cool down phases """
         PHASES = 10
 
-        """ Set the maximum number of generations """
-        MAX_GENERATIONS = 250
+        MAX_GENERATIONS = self.MAX_GENERATIONS
 
         """ Set the number of nodes in the problem """
         NODE_COUNT = problem.n
 
-        populationSize = 25
+        populationSize = self.POPULATION_SIZE
 
         """ Configure model with the system prompt and temperature """
         systemPrompt = PRManager.getSystemPrompt(populationSize=populationSize)
-        currentModelTemperature = 2
+        currentModelTemperature = self.initial_temperature
         self.model.configure(systemPrompt, currentModelTemperature)
 
         """ Initialize population and get the best solution length """
+        initializationStart = time.perf_counter()
         currentPopulation = self.population_initializer.initialize(
             populationSize, problem
         )
-        bestSolutionLength = currentPopulation[-1][1]
+        expDataManager.logInitialization(
+            time.perf_counter() - initializationStart,
+            len(currentPopulation),
+            getattr(self.population_initializer, "lastRunStats", None),
+        )
+        # permutations the initializer produced several times were dropped by its Population
+        self.generationDuplicates = currentPopulation.duplicates
+        bestSolutionLength = currentPopulation.best.cost
 
         """ Counter for how many consecutive bad iterations occured
         to update the model's temperature and population size """
@@ -49,17 +121,19 @@ class PAIRSolver(LLMTSPSolver):
 
         problem_optimal_distance = expDataManager.optimalDistance
         optimalityGap: float | int = np.inf
+
+        """ Lower bound for the gap when the optimum is unknown, reaching it proves optimality """
+        lowerBound = QAPBounds.lower_bound(problem)
         for generation in range(1, MAX_GENERATIONS + 1):
             """ Saving Generation Data """
-            variance = PAIRSolver._getGenerationVariance(
-                [x[1] for x in currentPopulation]
-            )
+            variance = PAIRSolver._getGenerationVariance(currentPopulation)
             optimalityGap = PAIRSolver._calculateOptimalityGap(
                 bestSolutionLength, problem_optimal_distance
             )
             bestSolutionProportion = PAIRSolver._calculateBestSolutionProportion(
-                [x[1] for x in currentPopulation]
+                currentPopulation
             )
+            boundGap = QAPBounds.gap(bestSolutionLength, lowerBound)
 
             expDataManager.addIterationData(
                 generation,
@@ -69,6 +143,9 @@ class PAIRSolver(LLMTSPSolver):
                 bestSolutionProportion,
                 populationSize,
                 optimalityGap,
+                lowerBound,
+                boundGap,
+                self.generationDuplicates,
             )
 
             """ Log Generation Data """
@@ -76,16 +153,20 @@ class PAIRSolver(LLMTSPSolver):
                 bestSolutionLength, generation, currentModelTemperature, populationSize
             )
 
-            """ Exit if reached optimal distance """
-            if currentPopulation[-1][1] == problem_optimal_distance:
+            """ Exit if reached optimal distance or the lower bound """
+            if (
+                currentPopulation.best.cost == problem_optimal_distance
+                or currentPopulation.best.cost <= lowerBound
+            ):
                 expDataManager.saveSolution(
-                    currentPopulation[-1][0],
+                    currentPopulation.best.assignment.tolist(),
                     bestSolutionLength,
                     problem_optimal_distance,
                     optimalityGap,
                     generation,
                 )
-                return currentPopulation[-1][0], generation
+                self.bestIndividual = currentPopulation.best
+                return currentPopulation.best.assignment.tolist(), generation
 
             """
             - use current generation(population) to generate prompt
@@ -123,53 +204,121 @@ class PAIRSolver(LLMTSPSolver):
 
             # combine populations
             currentPopulation = PAIRSolver._combinePopulations(
-                currentPopulation, newPopulation, populationSize
+                currentPopulation, newPopulation, populationSize, self.diversity_selector
             )
 
             expDataManager.logPopulation(currentPopulation)
 
+            # hook for solvers coordinating several populations, None ends the run
+            hookedPopulation = self._onGeneration(generation, currentPopulation)
+            if hookedPopulation is None:
+                break
+            currentPopulation = hookedPopulation
+
             bestSolutionLength = (
-                currentPopulation[-1][1]
-                if currentPopulation[-1][1] < bestSolutionLength
+                currentPopulation.best.cost
+                if currentPopulation.best.cost < bestSolutionLength
                 else bestSolutionLength
             )
 
         # if the optimal distance is not reached, return the best tour and the generation number
         expDataManager.saveSolution(
-            currentPopulation[-1][0],
+            currentPopulation.best.assignment.tolist(),
             bestSolutionLength,
             problem_optimal_distance,
             optimalityGap,
         )
-        return currentPopulation[-1][0], MAX_GENERATIONS
+        self.bestIndividual = currentPopulation.best
+        return currentPopulation.best.assignment.tolist(), generation
 
     """ Internal Helper Methods """
 
+    def _onGeneration(
+        self, generation: int, currentPopulation: Population
+    ) -> Population | None:
+        return currentPopulation
+
     def _getNewPopulation(
         self,
         problem: QAPProblem,
-        currentPopulation,
+        currentPopulation: Population,
         NODE_COUNT,
         populationSize,
         expDataManager: ExperimentDataManager,
-    ) -> list[tuple[list[int], float]]:
-        # get new generation prompt
-        newGenPrompt = PRManager.getNewGenerationPrompt(
-            currentPopulation, NODE_COUNT, populationSize
+    ) -> Population:
+        # search from the elites on the idle CPU while the model generates
+        if self.backgroundSearch is not None:
+            self.backgroundSearch.start(currentPopulation)
+        requestStart = time.perf_counter()
+
+        try:
+            if self.fan_out > 1:
+                newGenerationTraces = asyncio.run(
+                    self._requestTracesConcurrently(
+                        currentPopulation, NODE_COUNT, populationSize, expDataManager
+                    )
+                )
+            else:
+                # get new generation prompt
+                newGenPrompt = PRManager.getNewGenerationPrompt(
+                    currentPopulation, NODE_COUNT, populationSize
+                )
+                newGenerationTraces = self._requestTraces(
+                    newGenPrompt, NODE_COUNT, expDataManager
+                )
+        finally:
+            backgroundPopulation = Population(n=NODE_COUNT)
+            if self.backgroundSearch is not None:
+                backgroundPopulation = self.backgroundSearch.finish(
+                    time.perf_counter() - requestStart
+                )
+
+        # calculate the lengths of the new generation traces in one batched call,
+        # the parser only returns 0-based assignments
+        newPopulation = Population(n=NODE_COUNT)
+        if newGenerationTraces:
+            lengths = self._scoreTraces(problem, newGenerationTraces, expDataManager)
+            newPopulation = Population(
+                newGenerationTraces, [round(length, 3) for length in lengths]
+            )
+
+        # optionally polish the offspring with a bounded swap local search
+        if self.local_search_moves > 0:
+            newPopulation = self._improveOffspring(problem, newPopulation, expDataManager)
+
+        # merge the background results, logging what each source gained on the current best
+        if self.backgroundSearch is not None:
+            expDataManager.logImprovementSources(
+                currentPopulation.best.cost,
+                min(newPopulation.costs.tolist(), default=None),
+                min(backgroundPopulation.costs.tolist(), default=None),
+                self.backgroundSearch.lastRunStats,
+            )
+            newPopulation = newPopulation.merge(backgroundPopulation)
+
+        # remove offspring already in the population, repeated offspring were dropped
+        # by the populations they were collected in
+        newPopulation = newPopulation.difference(currentPopulation)
+        self.generationDuplicates = (
+            len(newGenerationTraces) + len(backgroundPopulation) - len(newPopulation)
         )
 
+        return newPopulation
+
+    def _requestTraces(
+        self, prompt: str, NODE_COUNT, expDataManager: ExperimentDataManager
+    ) -> list[list[int]]:
         # parse new generation traces
         maxRetries = 10
         while True:
             try:
                 # get new generation response from the llm
-                newGenResponse = self.model.run(newGenPrompt)
+                newGenResponse = self.model.run(prompt)
                 expDataManager.logModelResponse(newGenResponse)
 
-                newGenerationTraces = PRManager.parseNewGeneration(
+                return PRManager.parseNewGeneration(
                     newGenResponse, nodeCount=NODE_COUNT
                 )
-                break
             except Exception as e:
                 maxRetries -= 1
                 if maxRetries == 0:
@@ -177,31 +326,138 @@ class PAIRSolver(LLMTSPSolver):
                 expDataManager.logError(f"Error parsing response: {e}")
                 time.sleep(1)
 
-        # calculate the lengths of the new generation traces
-        newPopulation = []
-        for trace in newGenerationTraces:
-            length = round(problem.calculate_cost(trace), 3)
-            newPopulation.append((trace, length))
-
-        # remove duplicates from the new population
-        newPopulation = list(
-            filter(
-                lambda newIndividual: all(
-                    newIndividual[0] != currentIndividual[0]
-                    for currentIndividual in currentPopulation
-                ),
-                newPopulation,
+    async def _requestTracesAsync(
+        self,
+        prompt: str,
+        NODE_COUNT,
+        expDataManager: ExperimentDataManager,
+        semaphore: asyncio.Semaphore,
+    ) -> list[list[int]]:
+        maxRetries = 10
+        while True:
+            try:
+                async with semaphore:
+                    newGenResponse = await self.model.run_async(prompt)
+                expDataManager.logModelResponse(newGenResponse)
+
+                return PRManager.parseNewGeneration(
+                    newGenResponse, nodeCount=NODE_COUNT
+                )
+            except Exception as e:
+                maxRetries -= 1
+                if maxRetries == 0:
+                    raise e
+                expDataManager.logError(f"Error parsing response: {e}")
+                await asyncio.sleep(1)
+
+    async def _requestTracesConcurrently(
+        self,
+        currentPopulation: Population,
+        NODE_COUNT,
+        populationSize,
+        expDataManager: ExperimentDataManager,
+    ) -> list[list[int]]:
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        prompts = [
+            PRManager.getNewGenerationPrompt(parents, NODE_COUNT, count)
+            for parents, count in self._splitOffspringRequest(
+                currentPopulation, populationSize
             )
+        ]
+        results = await asyncio.gather(
+            *(
+                self._requestTracesAsync(prompt, NODE_COUNT, expDataManager, semaphore)
+                for prompt in prompts
+            ),
+            return_exceptions=True,
         )
 
-        # sort new population by length descendingly
-        newPopulation = sorted(newPopulation, key=lambda x: x[1], reverse=True)
+        # a slice that keeps failing only costs its share of the offspring
+        failures = [result for result in results if isinstance(result, BaseException)]
+        if len(failures) == len(results):
+            raise failures[0]
+        for failure in failures:
+            expDataManager.logError(f"Sub-population request failed: {failure}")
+
+        return [
+            trace
+            for result in results
+            if not isinstance(result, BaseException)
+            for trace in result
+        ]
+
+    def _splitOffspringRequest(
+        self, currentPopulation: Population, populationSize
+    ) -> list[tuple[Population, int]]:
+        """(parents, offspring count) of every sub-prompt, the counts add up to populationSize"""
+        fanOut = max(1, min(self.fan_out, populationSize))
+        base, extra = divmod(populationSize, fanOut)
+
+        requests = []
+        for k in range(fanOut):
+            parents = currentPopulation
+            if self.split_parents:
+                # strided shares keep a spread of costs, every share includes the best individual
+                shares = np.arange(k, len(currentPopulation), fanOut)
+                parents = currentPopulation.select(
+                    np.union1d(shares, [len(currentPopulation) - 1])
+                )
+            requests.append((parents, base + (k < extra)))
 
-        return newPopulation
+        return requests
+
+    def _scoreTraces(
+        self,
+        problem: QAPProblem,
+        traces: list[list[int]],
+        expDataManager: ExperimentDataManager,
+    ) -> list[float]:
+        if self.costCache is None:
+            return [
+                length.item()
+                for length in problem.calculate_costs(traces, one_based=False)
+            ]
+
+        # traces already seen in earlier generations are looked up instead of re-scored
+        hitsBefore, missesBefore = self.costCache.hits, self.costCache.misses
+        lengths = self.costCache.costs(traces)
+        expDataManager.logCacheStats(
+            self.costCache.hits - hitsBefore,
+            self.costCache.misses - missesBefore,
+            self.costCache,
+        )
+
+        return lengths
+
+    def _improveOffspring(
+        self,
+        problem: QAPProblem,
+        newPopulation: Population,
+        expDataManager: ExperimentDataManager,
+    ) -> Population:
+        if not len(newPopulation):
+            return newPopulation
+
+        # every offspring descends at once, each stops at its own local optimum
+        start = time.perf_counter()
+        neighborhood = BatchSwapNeighborhood(problem, newPopulation.assignments)
+        moves = neighborhood.local_search(
+            max_moves=self.local_search_moves,
+            first_improvement=self.local_search_first_improvement,
+        )
+
+        expDataManager.logLocalSearch(
+            newPopulation.costs.tolist(),
+            neighborhood.costs.tolist(),
+            int(moves.sum()),
+            time.perf_counter() - start,
+        )
+        # offspring descending into the same local optimum are kept once
+        return Population(neighborhood.assignments, neighborhood.costs)
 
     def _updateTemperatureAndPopulationSize(
         self,
-        newPopulation,
+        newPopulation: Population,
         bestSolutionLength,
         currentModelTemperature,
         systemPrompt,
@@ -211,7 +467,7 @@ class PAIRSolver(LLMTSPSolver):
         # check if the new population has individuals
         if len(newPopulation) > 0:
             # if the new population's best individual is worse than the best solution, increment worseIterations
-            if newPopulation[-1][1] >= bestSolutionLength:
+            if newPopulation.best.cost >= bestSolutionLength:
                 worseIterations += 1
             # reset, you broke the cycle of no positive improvement
             else:
@@ -228,33 +484,34 @@ class PAIRSolver(LLMTSPSolver):
         return round(currentModelTemperature, 3), populationSize, worseIterations
 
     @staticmethod
-    def _calculateOptimalityGap(minDistance: float, optimalDistance: float) -> float:
+    def _calculateOptimalityGap(
+        minDistance: float, optimalDistance: float | None
+    ) -> float:
+        # no gap can be reported without a (non-zero) optimum
+        if not optimalDistance:
+            return float("nan")
         return round((((minDistance - optimalDistance) / optimalDistance) * 100), 2)
 
     @staticmethod
     def _combinePopulations(
-        currentPopulation, newPopulation, populationSize
-    ) -> list[tuple[list[int], float]]:
-        # add the new population to the current population
-        currentPopulation.extend(newPopulation)
-
-        # sort the population by the tour lengths in descending order
-        currentPopulation = sorted(currentPopulation, key=lambda x: x[1], reverse=True)
-
-        # keep the best populationSize individuals
-        currentPopulation = currentPopulation[-populationSize:]
+        currentPopulation: Population,
+        newPopulation: Population,
+        populationSize,
+        selector: DiversitySelector | None = None,
+    ) -> Population:
+        # the selector keeps the best individual, so bestSolutionLength stays valid
+        if selector is not None:
+            return selector.select_population(
+                currentPopulation.merge(newPopulation), populationSize
+            )
 
-        return currentPopulation
+        # keep the best populationSize individuals, one copy of every permutation
+        return currentPopulation.merge(newPopulation, populationSize)
 
     @staticmethod
-    def _getGenerationVariance(populationDistances: list[float]) -> float:
-        return float(round(np.var(populationDistances), 2))
+    def _getGenerationVariance(population: Population) -> float:
+        return round(population.variance(), 2)
 
     @staticmethod
-    def _calculateBestSolutionProportion(populationDistances: list[float]) -> float:
-        populationDistances.sort()
-        return round(
-            populationDistances.count(populationDistances[0])
-            / len(populationDistances),
-            3,
-        )
+    def _calculateBestSolutionProportion(population: Population) -> float:
+        return round(population.bestProportion(), 3)
@@ -0,0 +1,98 @@
+import time
+
+import numpy as np
+
+from src.QAPLoader.QAPBounds import QAPBounds
+from src.QAPLoader.QAPProblem import QAPProblem
+from src.QAPLoader.RobustTabuSearch import RobustTabuSearch
+from src.ExperimentDataManager import ExperimentDataManager
+from src.Models.Model import Model
+from src.PopulationInitializers.PopulationInitializer import PopulationInitializer
+from src.Solvers.LLMTSPSolver import LLMTSPSolver
+from src.Solvers.PAIRSolver import PAIRSolver
+
+
+class RobustTabuSearchSolver(LLMTSPSolver):
+    """
+    Non-LLM baseline: a single robust tabu search started from the best individual
+    of the population initializer. The model is never prompted, it only names the
+    experiment files. Every block of iterations is logged like a PAIR generation.
+    """
+
+    def __init__(
+        self,
+        model: Model,
+        population_initializer: PopulationInitializer,
+        iterations_per_node: int = 1000,
+        report_every_per_node: int = 20,
+        seed: int | None = None,
+    ):
+        super().__init__(model, population_initializer)
+
+        """ Search budget and logging interval, both as multiples of the problem size """
+        self.iterations_per_node = iterations_per_node
+        self.report_every_per_node = report_every_per_node
+        self.seed = seed
+
+    def solve(self, expDataManager: ExperimentDataManager) -> tuple[list[int], float]:
+        problem: QAPProblem = expDataManager.problem
+
+        populationSize = PAIRSolver.POPULATION_SIZE
+
+        """ Initialize population, the search starts from its best individual """
+        initializationStart = time.perf_counter()
+        population = self.population_initializer.initialize(populationSize, problem)
+        expDataManager.logInitialization(
+            time.perf_counter() - initializationStart,
+            len(population),
+            getattr(self.population_initializer, "lastRunStats", None),
+        )
+        search = RobustTabuSearch(problem, seed=self.seed)
+        search.reset(population.best.assignment)
+
+        problem_optimal_distance = expDataManager.optimalDistance
+        lowerBound = QAPBounds.lower_bound(problem)
+        target = lowerBound if not problem_optimal_distance else max(problem_optimal_distance, lowerBound)
+
+        reportEvery = max(1, self.report_every_per_node * problem.n)
+        generations = -(-self.iterations_per_node * problem.n // reportEvery)
+        optimalityGap: float = np.inf
+
+        for generation in range(1, generations + 1):
+            bestCost = search.search(reportEvery, target_cost=target)
+
+            optimalityGap = PAIRSolver._calculateOptimalityGap(
+                bestCost, problem_optimal_distance
+            )
+            expDataManager.addIterationData(
+                generation,
+                bestCost,
+                0,
+                0.0,
+                1.0,
+                1,
+                optimalityGap,
+                lowerBound,
+                QAPBounds.gap(bestCost, lowerBound),
+            )
+            expDataManager.logGenerationStatus(bestCost, generation, 0, 1)
+            expDataManager.logSearchSpeed(search.iteration, search.elapsed)
+
+            """ Exit if reached optimal distance or the lower bound """
+            if bestCost <= target:
+                expDataManager.saveSolution(
+                    search.get_best_assignment(),
+                    bestCost,
+                    problem_optimal_distance,
+                    optimalityGap,
+                    generation,
+                )
+                return search.get_best_assignment(), generation
+
+        expDataManager.saveSolution(
+            search.get_best_assignment(),
+            search.best_cost,
+            problem_optimal_distance,
+            optimalityGap,
+        )
+        return search.get_best_assignment(), generations
@@ -0,0 +1,57 @@
+import itertools
+import sys
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.QAPLoader.QAPProblem import QAPProblem  # noqa: E402
+
+QAPDATA = ROOT / "qapdata"
+QAPSOLN = ROOT / "qapsoln"
+
+
+def random_problem(
+    n: int,
+    seed: int,
+    symmetric: bool = False,
+    flow_density: float = 1.0,
+    distance_density: float = 1.0,
+) -> QAPProblem:
+    """Random instance, asymmetric with non-zero diagonals unless symmetric is set."""
+    rng = np.random.default_rng(seed)
+
+    def matrix(density: float) -> np.ndarray:
+        values = rng.integers(1, 20, size=(n, n)) * (rng.random((n, n)) < density)
+        if symmetric:
+            values = np.triu(values, 1)
+            values = values + values.T
+        return values
+
+    return QAPProblem(matrix(distance_density), matrix(flow_density), f"random{n}_{seed}")
+
+
+def brute_force_cost(problem: QAPProblem, assignment) -> int:
+    """sum F[i][j] * D[p[i]][p[j]] with plain Python loops."""
+    F, D = problem.flow_matrix, problem.distance_matrix
+    return sum(
+        int(F[i, j]) * int(D[assignment[i], assignment[j]])
+        for i in range(problem.n)
+        for j in range(problem.n)
+    )
+
+
+def swapped(assignment, i: int, j: int) -> list:
+    result = list(assignment)
+    result[i], result[j] = result[j], result[i]
+    return result
+
+
+def brute_force_optimum(problem: QAPProblem) -> int:
+    """Cheapest cost over all n! assignments, without the QAPProblem kernels."""
+    P = np.array(list(itertools.permutations(range(problem.n))))
+    F = np.asarray(problem.flow_matrix, dtype=np.int64)
+    D = np.asarray(problem.distance_matrix, dtype=np.int64)
+    return int((F[None] * D[P[:, :, None], P[:, None, :]]).sum(axis=(1, 2)).min())
@@ -0,0 +1,123 @@
+import numpy as np
+import pytest
+
+from src.Population.Population import Population
+from src.PopulationInitializers.DiversitySelector import DiversitySelector
+
+
+def random_population(seed: int, m: int = 12, n: int = 6, max_cost: int = 8):
+    rng = np.random.default_rng(seed)
+    assignments = np.array([rng.permutation(n) for _ in range(m)])
+    costs = rng.integers(0, max_cost, size=m)
+    return assignments, costs
+
+
+def unique_rows(assignments, costs):
+    """First occurrence of every permutation, as a {row: cost} dict in input order."""
+    rows = {}
+    for row, cost in zip(map(tuple, assignments), costs.tolist()):
+        rows.setdefault(row, cost)
+    return rows
+
+
+def test_rows_are_normalized_deduplicated_and_sorted():
+    assignments, costs = random_population(0)
+    assignments = np.vstack([assignments, assignments[:3] + 1, assignments[4:5]])
+    costs = np.concatenate([costs, [100, 100, 100], [100]])
+    population = Population(assignments, costs)
+
+    expected = unique_rows(assignments - assignments.min(axis=1, keepdims=True), costs)
+    assert population.duplicates == 4
+    assert len(population) == len(expected)
+    assert {tuple(row): cost for row, cost in zip(population.assignments.tolist(), population.costs.tolist())} == expected
+    assert (np.diff(population.costs) <= 0).all()
+    assert population.best.cost == min(expected.values())
+
+
+def test_membership_ignores_the_encoding():
+    assignments, costs = random_population(1)
+    population = Population(assignments, costs)
+
+    for row in assignments:
+        assert row in population
+        assert row + 1 in population
+    absent = next(
+        row for row in map(tuple, np.random.default_rng(2).permuted(np.tile(np.arange(6), (50, 1)), axis=1))
+        if row not in {tuple(r) for r in assignments.tolist()}
+    )
+    assert np.array(absent) not in population
+
+
+@pytest.mark.parametrize("k", [None, 0, 1, 5, 12, 30])
+@pytest.mark.parametrize("seed", range(4))
+def test_merge_keeps_the_k_cheapest(k, seed):
+    a, a_costs = random_population(seed)
+    b, b_costs = random_population(seed + 100)
+    # share some rows with other costs, the copy already in the population wins
+    b[:4], b_costs[:4] = a[3:7], 99
+    first, second = Population(a, a_costs), Population(b, b_costs)
+    merged = first.merge(second, k)
+
+    union = unique_rows(
+        np.vstack([first.assignments, second.assignments]),
+        np.concatenate([first.costs, second.costs]),
+    )
+    cheapest = sorted(union.values())[: len(union) if k is None else k]
+
+    shared = {tuple(row) for row in first.assignments.tolist()} & {
+        tuple(row) for row in second.assignments.tolist()
+    }
+    assert len(shared) >= 4
+    assert merged.duplicates == len(shared)
+    assert sorted(merged.costs.tolist()) == cheapest
+    assert (np.diff(merged.costs) <= 0).all()
+    for row, cost in zip(map(tuple, merged.assignments.tolist()), merged.costs.tolist()):
+        assert union[row] == cost
+    assert len({row.tobytes() for row in merged.assignments}) == len(merged)
+
+
+def test_difference_drops_shared_permutations():
+    a, a_costs = random_population(5)
+    b, b_costs = random_population(6)
+    b[:3] = a[:3] + 1
+    first, second = Population(a, a_costs), Population(b, b_costs)
+    shared = {tuple(row) for row in first.assignments.tolist()} & {
+        tuple(row) for row in second.assignments.tolist()
+    }
+
+    fresh = second.difference(first)
+    assert len(fresh) == len(second) - len(shared)
+    assert fresh.duplicates == second.duplicates + len(shared)
+    assert not any(tuple(row) in shared for row in fresh.assignments.tolist())
+    assert (np.diff(fresh.costs) <= 0).all()
+
+
+def test_concatenate_counts_duplicates():
+    a, a_costs = random_population(7)
+    population = Population.concatenate([Population(a, a_costs), Population(a, a_costs + 1)])
+    assert len(population) == len(Population(a, a_costs))
+    assert population.duplicates == len(a) + 2 * Population(a, a_costs).duplicates
+
+
+def test_statistics_match_brute_force():
+    assignments, costs = random_population(8, m=15, n=7, max_cost=4)
+    population = Population(assignments, costs)
+
+    hamming = DiversitySelector.hamming_matrix(population.assignments)
+    m = len(population)
+    assert population.diversity() == pytest.approx(hamming[np.triu_indices(m, 1)].mean())
+    assert population.variance() == pytest.approx(np.var(population.costs))
+    assert population.bestProportion() == pytest.approx(
+        np.count_nonzero(population.costs == population.costs.min()) / m
+    )
+    assert Population(assignments[:1], costs[:1]).diversity() == 0.0
+
+
+def test_slices_keep_the_order():
+    assignments, costs = random_population(9)
+    population = Population(assignments, costs)
+    tail = population[-3:]
+    assert tail.costs.tolist() == population.costs[-3:].tolist()
+    assert tail.best.cost == population.best.cost
+    with pytest.raises(ValueError):
+        population[::-1]
@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+from conftest import QAPDATA, QAPSOLN, brute_force_optimum, random_problem
+from src.QAPLoader.QAPBounds import QAPBounds
+from src.QAPLoader.QAPLibLoader import QAPLIBLoader
+
+INSTANCES = ["nug12", "chr12a", "had12", "rou12", "scr12", "tai12a", "tai12b", "esc16a", "els19", "lipa20a", "bur26a", "kra30a"]
+
+
+@pytest.mark.parametrize("seed", range(6))
+@pytest.mark.parametrize("symmetric", [False, True])
+def test_bounds_do_not_exceed_the_brute_force_optimum(seed, symmetric):
+    problem = random_problem(7, 20 + seed, symmetric)
+    optimum = brute_force_optimum(problem)
+    bounds = QAPBounds.compute(problem, use_cache=False)
+
+    assert bounds["gilmore_lawler"] <= optimum
+    if symmetric:
+        assert bounds["projection"] is not None
+    if bounds["projection"] is not None:
+        assert bounds["projection"] <= optimum
+    assert bounds["best"] == max(b for k, b in bounds.items() if k != "best" and b is not None)
+
+
+def test_projection_needs_a_symmetric_matrix():
+    assert QAPBounds.projection(random_problem(6, 30)) is None
+
+
+@pytest.mark.parametrize("name", INSTANCES)
+def test_bounds_do_not_exceed_qaplib_optima(name):
+    problem = QAPLIBLoader.load_from_file(str(QAPDATA / f"{name}.dat"), use_cache=False)
+    optimum, _ = QAPLIBLoader.load_solution_from_file(str(QAPSOLN / f"{name}.sln"))
+    bounds = QAPBounds.compute(problem, use_cache=False)
+
+    for bound in bounds.values():
+        assert bound is None or bound <= optimum
+
+
+def test_cache_round_trip_and_corrupt_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(QAPBounds, "CACHE_DIR", tmp_path)
+    problem = random_problem(6, 31, symmetric=True)
+    bounds = QAPBounds.compute(problem)
+    path = QAPBounds._cache_path(problem)
+    assert path.exists()
+    assert QAPBounds.compute(problem) == bounds
+
+    # a half-written file is a cache miss and gets rewritten
+    path.write_text('{"gilmore')
+    assert QAPBounds.compute(problem) == bounds
+    assert QAPBounds.compute(problem, use_cache=False) == bounds
+
+
+def test_gap():
+    assert QAPBounds.gap(110, 100) == 10.0
+    assert np.isnan(QAPBounds.gap(110, 0))
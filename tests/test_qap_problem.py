@@ -0,0 +1,86 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from conftest import brute_force_cost, random_problem, swapped
+from src.QAPLoader.QAPProblem import AssignmentState
+
+# (flow density, distance density, expected kernel)
+KERNELS = [
+    (1.0, 1.0, "dense"),
+    (0.15, 1.0, "sparse-flow"),
+    (1.0, 0.15, "sparse-distance"),
+]
+
+
+@pytest.mark.parametrize("flow_density, distance_density, kernel", KERNELS)
+@pytest.mark.parametrize("symmetric", [False, True])
+def test_costs_match_brute_force(flow_density, distance_density, kernel, symmetric):
+    problem = random_problem(7, 1, symmetric, flow_density, distance_density)
+    assert problem.kernel == kernel
+
+    assignments = np.array([np.random.default_rng(k).permutation(7) for k in range(40)])
+    expected = [brute_force_cost(problem, p) for p in assignments]
+
+    assert problem.calculate_costs(assignments).tolist() == expected
+    assert problem.calculate_costs(assignments + 1, one_based=True).tolist() == expected
+    # the legacy single-assignment API is 1-based
+    assert problem.calculate_cost((assignments[0] + 1).tolist()) == expected[0]
+
+
+def test_costs_are_chunked_consistently():
+    problem = random_problem(6, 2)
+    assignments = np.array(list(itertools.permutations(range(6))))[:300]
+    whole = problem.calculate_costs(assignments)
+
+    problem.BATCH_CHUNK_ELEMENTS = 6 * 6 * 7
+    assert (problem.calculate_costs(assignments) == whole).all()
+
+
+def test_costs_reject_invalid_assignments():
+    problem = random_problem(5, 3)
+    with pytest.raises(ValueError):
+        problem.calculate_costs([[0, 1, 2, 3]])
+    with pytest.raises(ValueError):
+        problem.calculate_costs([[1, 2, 3, 4, 5]])
+
+
+@pytest.mark.parametrize("flow_density, distance_density, kernel", KERNELS)
+def test_swap_delta_matches_recomputed_cost(flow_density, distance_density, kernel):
+    problem = random_problem(7, 4, False, flow_density, distance_density)
+    assert problem.kernel == kernel
+    rng = np.random.default_rng(0)
+
+    for _ in range(10):
+        p = rng.permutation(7).tolist()
+        cost = brute_force_cost(problem, p)
+        for i, j in itertools.combinations(range(7), 2):
+            expected = brute_force_cost(problem, swapped(p, i, j)) - cost
+            assert problem.swap_delta(p, i, j) == expected
+            assert problem.swap_delta([x + 1 for x in p], i, j, one_based=True) == expected
+        assert problem.swap_delta(p, 3, 3) == 0
+
+
+def test_swap_deltas_match_swap_delta():
+    problem = random_problem(7, 5)
+    rng = np.random.default_rng(1)
+    assignments = np.array([rng.permutation(7) for _ in range(50)])
+    i = rng.integers(0, 7, size=50)
+    j = rng.integers(0, 7, size=50)
+
+    expected = [problem.swap_delta(p, a, b) for p, a, b in zip(assignments, i, j)]
+    assert problem.swap_deltas(assignments, i, j).tolist() == expected
+
+
+def test_assignment_state_tracks_swaps():
+    problem = random_problem(7, 6)
+    rng = np.random.default_rng(2)
+    state = AssignmentState(problem, rng.permutation(7))
+
+    for _ in range(30):
+        i, j = rng.choice(7, size=2, replace=False)
+        state.apply_swap(i, j)
+        assert state.cost == brute_force_cost(problem, state.assignment)
+
+    assert state.reset([1, 2, 3, 4, 5, 6, 7], one_based=True) == brute_force_cost(problem, range(7))
@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from conftest import QAPDATA, QAPSOLN
+from src.QAPLoader.QAPLibLoader import QAPLIBLoader
+
+from test_qap_bounds import INSTANCES
+
+
+def qaplib_text(n: int, distance: np.ndarray, flow: np.ndarray) -> str:
+    rows = [" ".join(map(str, row)) for row in np.vstack([distance, flow])]
+    return f"{n}\n\n" + "\n".join(rows[:n]) + "\n\n" + "\n".join(rows[n:]) + "\n"
+
+
+def test_parse_reads_distance_then_flow():
+    distance = np.arange(9).reshape(3, 3)
+    flow = np.arange(9, 18).reshape(3, 3)
+    problem = QAPLIBLoader._parse_qap_data(qaplib_text(3, distance, flow), "tiny")
+
+    assert problem.n == 3
+    assert (problem.distance_matrix == distance).all()
+    assert (problem.flow_matrix == flow).all()
+
+
+def test_parse_ignores_line_wrapping():
+    tokens = " ".join(map(str, [2, 0, 1, 1, 0, 0, 5, 6, 0]))
+    wrapped = "2\n0 1\n1\n0 0 5\n6 0\n"
+    assert (
+        QAPLIBLoader._parse_qap_data(wrapped, "a").flow_matrix
+        == QAPLIBLoader._parse_qap_data(tokens, "b").flow_matrix
+    ).all()
+
+
+@pytest.mark.parametrize("count", [0, 1, 9, 2 * 9 - 1, 2 * 9 + 1])
+def test_parse_rejects_token_counts_other_than_1_plus_2n2(count):
+    content = "3 " + " ".join("1" for _ in range(count))
+    with pytest.raises(ValueError):
+        QAPLIBLoader._parse_qap_data(content, "bad")
+
+
+@pytest.mark.parametrize("content", ["", "0", "-2 1 1", "2 1 2 3 x 1 2 3 4"])
+def test_parse_rejects_malformed_content(content):
+    with pytest.raises(ValueError):
+        QAPLIBLoader._parse_qap_data(content, "bad")
+
+
+def test_parse_solution():
+    cost, permutation = QAPLIBLoader._parse_qap_solution("4 30\n2 4 1 3\n", "tiny")
+    assert cost == 30
+    assert permutation == [1, 3, 0, 2]
+    with pytest.raises(ValueError):
+        QAPLIBLoader._parse_qap_solution("4 30\n2 4 1\n", "tiny")
+
+
+@pytest.mark.parametrize("name", INSTANCES)
+def test_qaplib_solutions_score_their_optimum(name):
+    problem = QAPLIBLoader.load_from_file(str(QAPDATA / f"{name}.dat"), use_cache=False)
+    optimum, permutation = QAPLIBLoader.load_solution_from_file(str(QAPSOLN / f"{name}.sln"))
+
+    # .sln files disagree on the orientation of the permutation
+    inverse = np.argsort(permutation)
+    costs = problem.calculate_costs([permutation, inverse])
+    assert optimum in costs.tolist()
+    assert costs.min() >= optimum
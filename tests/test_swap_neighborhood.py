@@ -0,0 +1,99 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from conftest import brute_force_cost, random_problem, swapped
+from src.QAPLoader.SwapNeighborhood import BatchSwapNeighborhood, SwapNeighborhood
+
+
+def brute_force_deltas(problem, assignment) -> np.ndarray:
+    """Off-diagonal swap deltas by recomputing both costs, the diagonal is left at 0."""
+    cost = brute_force_cost(problem, assignment)
+    deltas = np.zeros((problem.n, problem.n), dtype=np.int64)
+    for i, j in itertools.permutations(range(problem.n), 2):
+        deltas[i, j] = brute_force_cost(problem, swapped(assignment, i, j)) - cost
+    return deltas
+
+
+def off_diagonal(matrix: np.ndarray) -> np.ndarray:
+    return matrix[~np.eye(matrix.shape[-1], dtype=bool)]
+
+
+@pytest.mark.parametrize("symmetric", [False, True])
+def test_delta_matrix_matches_brute_force(symmetric):
+    problem = random_problem(7, 10, symmetric)
+    assignment = np.random.default_rng(0).permutation(7)
+    neighborhood = SwapNeighborhood(problem, assignment)
+
+    assert neighborhood.cost == brute_force_cost(problem, assignment)
+    assert (off_diagonal(neighborhood.delta) == off_diagonal(brute_force_deltas(problem, assignment))).all()
+    assert (np.diag(neighborhood.delta) == SwapNeighborhood.NO_MOVE).all()
+
+
+@pytest.mark.parametrize("symmetric", [False, True])
+def test_taillard_updates_stay_exact(symmetric):
+    problem = random_problem(7, 11, symmetric)
+    rng = np.random.default_rng(1)
+    neighborhood = SwapNeighborhood(problem, rng.permutation(7))
+
+    for _ in range(25):
+        r, s = rng.choice(7, size=2, replace=False)
+        neighborhood.apply_move(r, s)
+        p = neighborhood.get_assignment()
+        assert neighborhood.cost == brute_force_cost(problem, p)
+        assert (off_diagonal(neighborhood.delta) == off_diagonal(brute_force_deltas(problem, p))).all()
+
+
+def test_local_search_reaches_a_swap_local_optimum():
+    problem = random_problem(7, 12)
+    neighborhood = SwapNeighborhood(problem, np.random.default_rng(2).permutation(7))
+    cost = neighborhood.local_search()
+
+    p = neighborhood.get_assignment()
+    assert cost == brute_force_cost(problem, p)
+    assert (off_diagonal(brute_force_deltas(problem, p)) >= 0).all()
+
+
+@pytest.mark.parametrize("symmetric", [False, True])
+def test_batch_deltas_match_brute_force(symmetric):
+    problem = random_problem(7, 13, symmetric)
+    rng = np.random.default_rng(3)
+    assignments = np.array([rng.permutation(7) for _ in range(6)])
+    batch = BatchSwapNeighborhood(problem, assignments)
+
+    for b, assignment in enumerate(assignments):
+        assert batch.costs[b] == brute_force_cost(problem, assignment)
+        assert (off_diagonal(batch.delta[b]) == off_diagonal(brute_force_deltas(problem, assignment))).all()
+
+
+@pytest.mark.parametrize("first_improvement", [False, True])
+def test_batch_moves_stay_exact(first_improvement):
+    problem = random_problem(7, 14)
+    rng = np.random.default_rng(4)
+    batch = BatchSwapNeighborhood(problem, np.array([rng.permutation(7) for _ in range(6)]))
+
+    for step in range(10):
+        # alternate between moving every member in place and moving a subset
+        members = np.arange(6) if step % 2 == 0 else np.array([1, 4])
+        r, s, _ = batch.select_moves(first_improvement)
+        batch.apply_moves(members, r[members], s[members])
+
+        for b, assignment in enumerate(batch.get_assignments()):
+            assert batch.costs[b] == brute_force_cost(problem, assignment)
+            assert (off_diagonal(batch.delta[b]) == off_diagonal(brute_force_deltas(problem, assignment))).all()
+
+
+@pytest.mark.parametrize("first_improvement", [False, True])
+def test_batch_local_search_matches_single(first_improvement):
+    problem = random_problem(7, 15)
+    rng = np.random.default_rng(5)
+    assignments = np.array([rng.permutation(7) for _ in range(8)])
+
+    batch = BatchSwapNeighborhood(problem, assignments)
+    batch.local_search(first_improvement=first_improvement)
+
+    for b, assignment in enumerate(assignments):
+        single = SwapNeighborhood(problem, assignment)
+        assert batch.costs[b] == single.local_search(first_improvement=first_improvement)
+        assert batch.get_assignments()[b] == single.get_assignment()